@@ -0,0 +1,10 @@
+"""
+Snowmelt Control System - Compatibility Helpers
+Smooths over differences between the Python versions shipped by Raspberry Pi OS
+"""
+
+import sys
+
+# Keyword arguments for @dataclass: slotted dataclasses need Python 3.10+
+# (Bookworm); Buster and Bullseye go without
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -5,7 +5,7 @@ Implements the control algorithms for snowmelt and DHW systems
 
 import logging
 from datetime import datetime, time as dtime, timedelta
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, NamedTuple
 from dataclasses import dataclass, field
 from threading import Lock, RLock
 from enum import Enum
@@ -26,9 +26,9 @@ class SystemState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Setpoints:
-    """Temperature setpoints"""
+    """Temperature setpoints (immutable; replaced rather than edited)"""
     high_temp: float
     delta_t: float
     
@@ -74,6 +74,22 @@ class ControlState:
     hx_delta_t: Optional[float] = None  # Heat exchanger effectiveness
 
 
+class PublishSnapshot(NamedTuple):
+    """Control state values pre-formatted as MQTT payloads"""
+    snowmelt_enabled: str
+    dhw_enabled: str
+    eco_enabled: str
+    eco_active: str
+    snowmelt_state: str
+    dhw_state: str
+    glycol_high: str
+    glycol_delta: str
+    dhw_high: str
+    dhw_delta: str
+    eco_high: str
+    eco_delta: str
+
+
 class ControlLogic:
     """Main control logic for the snowmelt and DHW systems"""
 
@@ -87,6 +103,8 @@ class ControlLogic:
         self._state_lock = Lock()
         # Cached copy of state for fast GUI reads (no lock needed for reads)
         self._cached_state: Optional[ControlState] = None
+        self._state_version = 0  # Bumped whenever the cached state changes
+        self._publish_snapshot: Optional[tuple] = None  # (state_version, PublishSnapshot)
         self._on_state_change: Optional[Callable] = None
         # Setpoint persistence
         self._persistence = persistence
@@ -99,7 +117,13 @@ class ControlLogic:
 
     def _update_cached_state(self):
         """Update the cached state copy for GUI reads"""
-        self._cached_state = deepcopy(self.state)
+        cached = deepcopy(self.state)
+        changed = cached != self._cached_state
+        # Publish the new state before bumping the version: lock-free readers
+        # read the version first, so a new version always comes with new state
+        self._cached_state = cached
+        if changed:
+            self._state_version += 1
     
     def _load_setpoints(self, setpoint_config: Dict, eco_config: Dict):
         """Load setpoints from persistence (if available) or config defaults"""
@@ -448,6 +472,39 @@ class ControlLogic:
         with self._state_lock:
             return deepcopy(self.state)
 
+    def get_publish_snapshot(self) -> PublishSnapshot:
+        """Get state values formatted for publishing, rebuilt only when state changes"""
+        version = self._state_version
+        cached = self._publish_snapshot
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        state = self.get_state()
+        snapshot = PublishSnapshot(
+            snowmelt_enabled="ON" if state.snowmelt_enabled else "OFF",
+            dhw_enabled="ON" if state.dhw_enabled else "OFF",
+            eco_enabled="ON" if state.eco_enabled else "OFF",
+            eco_active="ON" if state.eco_active else "OFF",
+            snowmelt_state=state.snowmelt_state.value,
+            dhw_state=state.dhw_state.value,
+            glycol_high=str(state.glycol_setpoints.high_temp),
+            glycol_delta=str(state.glycol_setpoints.delta_t),
+            dhw_high=str(state.dhw_setpoints.high_temp),
+            dhw_delta=str(state.dhw_setpoints.delta_t),
+            eco_high=str(state.eco_setpoints.high_temp),
+            eco_delta=str(state.eco_setpoints.delta_t),
+        )
+        # Only cache if no state change landed while building; otherwise the
+        # next call rebuilds under the newer version
+        if self._state_version == version:
+            self._publish_snapshot = (version, snapshot)
+        return snapshot
+
+    @property
+    def state_version(self) -> int:
+        """Counter that changes whenever get_state() would return different values"""
+        return self._state_version
+
     def shutdown(self):
         """Shutdown control logic, saving any pending setpoints"""
         if self._persistence:
@@ -5,7 +5,6 @@ Discovers and displays all connected 1-Wire temperature sensors
 """
 
 import os
-import glob
 import sys
 import time
 
@@ -35,15 +34,15 @@ def read_temp(device_path):
 
 def discover_sensors():
     """Find all 1-Wire temperature sensors"""
-    devices = glob.glob(os.path.join(ONEWIRE_BASE_PATH, "28-*"))
+    with os.scandir(ONEWIRE_BASE_PATH) as entries:
+        devices = [e for e in entries if e.name.startswith("28-")]
     sensors = []
     
     for device in devices:
-        address = os.path.basename(device)
-        temp, error = read_temp(device)
+        temp, error = read_temp(device.path)
         sensors.append({
-            'address': address,
-            'path': device,
+            'address': device.name,
+            'path': device.path,
             'temperature_f': temp,
             'error': error
         })
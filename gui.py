@@ -8,20 +8,23 @@ import sys
 import logging
 import socket
 import subprocess
-from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, Callable
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGridLayout, QLabel, QPushButton, QFrame, QTabWidget, QTabBar,
+    QGridLayout, QFormLayout, QLabel, QPushButton, QFrame, QTabWidget, QTabBar,
     QGroupBox, QDoubleSpinBox, QTimeEdit, QMessageBox,
     QButtonGroup, QSizePolicy, QSpacerItem, QStyleOptionTab, QStyle
 )
-from PyQt5.QtCore import Qt, QTimer, QTime, pyqtSignal, QSize
-from PyQt5.QtGui import QFont, QPainter
+from PyQt5.QtCore import (
+    Qt, QTimer, QTime, QDate, QFile, QSignalBlocker, pyqtSignal, QSize, QObject
+)
+from PyQt5.QtGui import QFont, QPainter, QPalette, QColor
 
+import resources_rc  # noqa: F401  (registers :/styles/main.qss)
 from relays import EquipmentMode, RelayState
-from control import ControlLogic, ControlState, SystemState
+from control import ControlLogic, ControlState
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,33 @@ logger = logging.getLogger(__name__)
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 600
 TAB_COUNT = 3
+DASHBOARD_TAB, EQUIPMENT_TAB, SETTINGS_TAB = range(TAB_COUNT)
+
+# Interval of the clock / countdown / connectivity refresh
+TICK_INTERVAL_MS = 1000
+
+# Quiet period after the last setpoint tap before the edits are sent
+SETPOINT_FLUSH_MS = 100
+
+# Temperature states, indexed by StyleSheet._temp_state
+_TEMP_STATES = ("err", "high", "low", "ok")
+
+# Text colors for temperature and status labels, created once and applied
+# through the label palette rather than a stylesheet
+STATE_COLORS = {
+    "ok": QColor("#74c0fc"),
+    "high": QColor("#51cf66"),
+    "low": QColor("#ffa94d"),
+    "err": QColor("#ff6b6b"),
+    "idle": QColor("#adb5bd"),
+    "heating": QColor("#51cf66"),
+    "bypass": QColor("#74c0fc"),
+    "error": QColor("#ff6b6b"),
+    "on": QColor("#51cf66"),
+    "off": QColor("#adb5bd"),
+    "running": QColor("#ffa94d"),
+    "expired": QColor("#51cf66"),
+}
 
 
 class EqualTabBar(QTabBar):
@@ -64,6 +94,20 @@ def get_network_status() -> bool:
         return False
 
 
+def repolish(widget: QWidget):
+    """Re-apply stylesheet rules after changing a widget's dynamic property"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def set_text_color(label: QLabel, state: str):
+    """Recolor a label's text by swapping its palette color"""
+    pal = label.palette()
+    pal.setColor(QPalette.WindowText, STATE_COLORS[state])
+    label.setPalette(pal)
+
+
 class StatusIndicator(QFrame):
     """Small status indicator with colored dot and label"""
 
@@ -107,123 +151,51 @@ class StatusIndicator(QFrame):
 class StyleSheet:
     """Centralized stylesheet for the application"""
     
-    MAIN = """
-        QMainWindow {
-            background-color: #1a1a2e;
-        }
-        QWidget {
-            background-color: #1a1a2e;
-            color: #eaeaea;
-            font-family: 'DejaVu Sans', sans-serif;
-            font-size: 13px;
-        }
-        QTabWidget::pane {
-            border: 2px solid #3d3d5c;
-            border-radius: 8px;
-            background-color: #16213e;
-            padding: 4px;
-        }
-        QTabBar::tab {
-            background-color: #0f3460;
-            color: #eaeaea;
-            padding: 12px 0px;
-            margin-right: 2px;
-            border-top-left-radius: 8px;
-            border-top-right-radius: 8px;
-            font-size: 16px;
-            font-weight: bold;
-        }
-        QTabBar::tab:selected {
-            background-color: #e94560;
-        }
-        QTabBar::tab:hover:!selected {
-            background-color: #1a5276;
-        }
-        QGroupBox {
-            border: 2px solid #3d3d5c;
-            border-radius: 8px;
-            margin-top: 10px;
-            padding: 6px;
-            padding-top: 14px;
-            font-size: 14px;
-            font-weight: bold;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 6px;
-            color: #e94560;
-        }
-        QPushButton {
-            background-color: #0f3460;
-            color: #eaeaea;
-            border: 2px solid #3d3d5c;
-            border-radius: 6px;
-            padding: 6px 12px;
-            font-size: 13px;
-            font-weight: bold;
-            min-height: 36px;
-        }
-        QPushButton:hover {
-            background-color: #1a5276;
-            border-color: #e94560;
-        }
-        QPushButton:pressed {
-            background-color: #e94560;
-        }
-        QPushButton:checked {
-            background-color: #e94560;
-            border-color: #e94560;
-        }
-        QPushButton:disabled {
-            background-color: #2d2d44;
-            color: #666666;
-        }
-        QDoubleSpinBox, QTimeEdit {
-            background-color: #16213e;
-            border: 2px solid #3d3d5c;
-            border-radius: 6px;
-            padding: 4px 6px;
-            font-size: 18px;
-            font-weight: bold;
-            min-height: 40px;
-        }
-        QDoubleSpinBox:focus, QTimeEdit:focus {
-            border-color: #e94560;
-        }
-        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button,
-        QTimeEdit::up-button, QTimeEdit::down-button {
-            width: 0px;
-            height: 0px;
-            border: none;
-        }
-        QLabel {
-            font-size: 13px;
-        }
-    """
-    
+    # Base colors are applied as a Fusion palette by create_gui; the rules a
+    # palette can't express live in styles/main.qss (compiled into resources_rc)
+    RESOURCE = ":/styles/main.qss"
+
+    PALETTE = {
+        QPalette.Window: "#1a1a2e",
+        QPalette.WindowText: "#eaeaea",
+        QPalette.Base: "#16213e",
+        QPalette.AlternateBase: "#1a1a2e",
+        QPalette.Text: "#eaeaea",
+        QPalette.Button: "#0f3460",
+        QPalette.ButtonText: "#eaeaea",
+        QPalette.Highlight: "#e94560",
+        QPalette.HighlightedText: "#eaeaea",
+        QPalette.ToolTipBase: "#16213e",
+        QPalette.ToolTipText: "#eaeaea",
+    }
+
     @staticmethod
-    def temp_display(temp: Optional[float], high: float = None, low: float = None) -> str:
-        """Get color style based on temperature status"""
-        if temp is None:
-            return "color: #ff6b6b; font-weight: bold;"
-        if high is not None and temp >= high:
-            return "color: #51cf66; font-weight: bold;"
-        elif low is not None and temp <= low:
-            return "color: #ffa94d; font-weight: bold;"
-        else:
-            return "color: #74c0fc; font-weight: bold;"
+    def load_main() -> str:
+        """Read the main stylesheet from the compiled Qt resource"""
+        f = QFile(StyleSheet.RESOURCE)
+        if not f.open(QFile.ReadOnly | QFile.Text):
+            logger.error(f"Stylesheet resource not found: {StyleSheet.RESOURCE}")
+            return ""
+        try:
+            return bytes(f.readAll()).decode("utf-8")
+        finally:
+            f.close()
     
     @staticmethod
-    def status_indicator(active: bool) -> str:
-        """Get style for status indicator"""
-        color = "#51cf66" if active else "#495057"
-        return f"""
-            background-color: {color};
-            border-radius: 10px;
-            min-width: 20px; max-width: 20px;
-            min-height: 20px; max-height: 20px;
-        """
+    def temp_state(temp: Optional[float], high: float = None, low: float = None) -> str:
+        """Get the display state (err/high/low/ok) for a temperature reading"""
+        # Quantize to the displayed precision to keep the cache small
+        if temp is not None:
+            temp = round(temp, 1)
+        return StyleSheet._temp_state(temp, high, low)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _temp_state(temp: Optional[float], high: Optional[float], low: Optional[float]) -> str:
+        idx = (0 if temp is None else
+               1 if high is not None and temp >= high else
+               2 if low is not None and temp <= low else 3)
+        return _TEMP_STATES[idx]
     
     @staticmethod
     def enable_button(enabled: bool) -> str:
@@ -267,39 +239,36 @@ class TemperatureDisplay(QFrame):
         super().__init__()
         self.unit = unit
         self._value: Optional[float] = None
+        self._state: Optional[str] = None
+        self.setObjectName("tempDisplay")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(4)
         
         self.label = QLabel(label)
+        self.label.setObjectName("tempCaption")
         self.label.setAlignment(Qt.AlignCenter)
-        self.label.setStyleSheet("font-size: 12px; color: #adb5bd;")
         
         self.value_label = QLabel("--")
+        self.value_label.setObjectName("tempValue")
         self.value_label.setAlignment(Qt.AlignCenter)
-        self.value_label.setStyleSheet("font-size: 26px; font-weight: bold; color: #74c0fc;")
+        set_text_color(self.value_label, "ok")
         
         layout.addWidget(self.label)
         layout.addWidget(self.value_label)
-        
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #16213e;
-                border: 2px solid #3d3d5c;
-                border-radius: 8px;
-            }
-        """)
     
-    def set_value(self, value: Optional[float], style: str = None):
-        """Update the displayed value"""
-        self._value = value
-        if value is not None:
-            self.value_label.setText(f"{value:.1f}{self.unit}")
-        else:
-            self.value_label.setText("--")
-        if style:
-            self.value_label.setStyleSheet(f"font-size: 26px; {style}")
+    def set_value(self, value: Optional[float], state: str = None):
+        """Update the displayed value (no-op when nothing changed)"""
+        if value != self._value:
+            self._value = value
+            if value is not None:
+                self.value_label.setText(f"{value:.1f}{self.unit}")
+            else:
+                self.value_label.setText("--")
+        if state and state != self._state:
+            self._state = state
+            set_text_color(self.value_label, state)
 
 
 class SystemEnableButton(QPushButton):
@@ -619,6 +588,7 @@ class EquipmentControl(QFrame):
     def __init__(self, equipment_id: str, name: str):
         super().__init__()
         self.equipment_id = equipment_id
+        self._was_active = False
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 6, 10, 6)
@@ -626,12 +596,13 @@ class EquipmentControl(QFrame):
         
         # Status indicator
         self.status_indicator = QLabel()
-        self.status_indicator.setStyleSheet(StyleSheet.status_indicator(False))
+        self.status_indicator.setObjectName("equipmentStatus")
+        self.status_indicator.setProperty("active", False)
         self.status_indicator.setFixedSize(20, 20)
         
         # Name label
         name_label = QLabel(name)
-        name_label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        name_label.setObjectName("equipmentName")
         name_label.setFixedWidth(160)
         
         layout.addWidget(self.status_indicator)
@@ -651,24 +622,23 @@ class EquipmentControl(QFrame):
             layout.addWidget(btn)
         
         self.btn_auto.setChecked(True)
-        self.btn_auto.clicked.connect(lambda: self._on_mode_clicked("auto"))
-        self.btn_on.clicked.connect(lambda: self._on_mode_clicked("on"))
-        self.btn_off.clicked.connect(lambda: self._on_mode_clicked("off"))
+        self.btn_auto.setProperty("mode", "auto")
+        self.btn_on.setProperty("mode", "on")
+        self.btn_off.setProperty("mode", "off")
+        self.btn_group.buttonClicked.connect(self._on_mode_clicked)
         
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #16213e;
-                border: 2px solid #3d3d5c;
-                border-radius: 8px;
-            }
-        """)
+        self.setObjectName("equipmentControl")
         self.setFixedHeight(55)
     
-    def _on_mode_clicked(self, mode: str):
-        self.mode_changed.emit(self.equipment_id, mode)
+    def _on_mode_clicked(self, btn: QPushButton):
+        self.mode_changed.emit(self.equipment_id, btn.property("mode"))
     
     def update_state(self, state: RelayState):
-        self.status_indicator.setStyleSheet(StyleSheet.status_indicator(state.is_energized))
+        # Repolish only when the indicator actually flips
+        if state.is_energized != self._was_active:
+            self._was_active = state.is_energized
+            self.status_indicator.setProperty("active", state.is_energized)
+            repolish(self.status_indicator)
         mode_map = {
             EquipmentMode.AUTO: self.btn_auto,
             EquipmentMode.ON: self.btn_on,
@@ -689,6 +659,11 @@ class DashboardTab(QWidget):
     def __init__(self, control: ControlLogic):
         super().__init__()
         self.control = control
+        self._last: Dict[int, tuple] = {}  # id(label) -> last (text, status)
+        self._prev_obj: Optional[ControlState] = None  # Last snapshot applied
+        self._prev_state: Optional[tuple] = None  # (status, enabled, temps) last shown
+        self._last_sec = -1
+        self._last_date_str: Optional[str] = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -771,7 +746,8 @@ class DashboardTab(QWidget):
         self.timer_countdown = QLabel("Not Active")
         self.timer_countdown.setFixedWidth(100)
         self.timer_countdown.setAlignment(Qt.AlignCenter)
-        self.timer_countdown.setStyleSheet("font-size: 14px; font-weight: bold; color: #adb5bd;")
+        self.timer_countdown.setObjectName("statusValue")
+        set_text_color(self.timer_countdown, "off")
         timer_row.addWidget(self.timer_countdown)
 
         enable_group_layout.addLayout(timer_row)
@@ -782,11 +758,11 @@ class DashboardTab(QWidget):
         status_layout.setSpacing(15)
         
         self.snowmelt_status = QLabel("IDLE")
-        self.snowmelt_status.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.snowmelt_status.setObjectName("statusValue")
         self.dhw_status = QLabel("IDLE")
-        self.dhw_status.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.dhw_status.setObjectName("statusValue")
         self.eco_status = QLabel("OFF")
-        self.eco_status.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.eco_status.setObjectName("statusValue")
         
         status_layout.addWidget(QLabel("Snowmelt:"))
         status_layout.addWidget(self.snowmelt_status)
@@ -866,72 +842,97 @@ class DashboardTab(QWidget):
     def _on_timer_cancel(self):
         self.timer_cancelled.emit()
 
+    def _set_label(self, label: QLabel, text: str, status: str):
+        """Set label text and status color, skipping the update if both are unchanged"""
+        key = (text, status)
+        last = self._last.get(id(label))
+        if last != key:
+            self._last[id(label)] = key
+            label.setText(text)
+            if last is None or last[1] != status:
+                set_text_color(label, status)
+
     def update_display(self, state: ControlState):
-        colors = {
-            SystemState.IDLE: "#adb5bd",
-            SystemState.HEATING: "#51cf66",
-            SystemState.BYPASS: "#74c0fc",
-            SystemState.ERROR: "#ff6b6b"
-        }
-        
+        # get_state() hands out the same snapshot until the control loop
+        # publishes a new one, so most ticks only need the countdown
+        if state is not self._prev_obj and state != self._prev_obj:
+            self._prev_obj = state
+            self._update_fields(state)
+        self.update_countdown(state)
+
+    def _update_fields(self, state: ControlState):
+        # Compare field groups against the previous state and only touch the
+        # widgets whose inputs changed
+        glycol_sp = state.glycol_setpoints
+        dhw_sp = state.eco_setpoints if state.eco_active else state.dhw_setpoints
+        status = (state.snowmelt_state, state.dhw_state, state.eco_active)
+        enabled = (state.snowmelt_enabled, state.dhw_enabled, state.eco_enabled)
+        temps = (state.glycol_return_temp, state.glycol_supply_temp,
+                 state.hx_in_temp, state.hx_out_temp, state.hx_delta_t, state.dhw_tank_temp,
+                 glycol_sp.high_temp, glycol_sp.low_temp, dhw_sp.high_temp, dhw_sp.low_temp)
+        prev_status, prev_enabled, prev_temps = self._prev_state or (None, None, None)
+        self._prev_state = (status, enabled, temps)
+
         # Update status labels
-        color = colors.get(state.snowmelt_state, "#adb5bd")
-        self.snowmelt_status.setText(state.snowmelt_state.value.upper())
-        self.snowmelt_status.setStyleSheet(f"font-size: 14px; font-weight: bold; color: {color};")
-        
-        color = colors.get(state.dhw_state, "#adb5bd")
-        self.dhw_status.setText(state.dhw_state.value.upper())
-        self.dhw_status.setStyleSheet(f"font-size: 14px; font-weight: bold; color: {color};")
-        
-        eco_color = "#51cf66" if state.eco_active else "#adb5bd"
-        self.eco_status.setText("ON" if state.eco_active else "OFF")
-        self.eco_status.setStyleSheet(f"font-size: 14px; font-weight: bold; color: {eco_color};")
+        if status != prev_status:
+            self._set_label(self.snowmelt_status, state.snowmelt_state.value.upper(),
+                            state.snowmelt_state.value)
+            self._set_label(self.dhw_status, state.dhw_state.value.upper(),
+                            state.dhw_state.value)
+            eco = "on" if state.eco_active else "off"
+            self._set_label(self.eco_status, eco.upper(), eco)
         
         # Update enable buttons
-        self.btn_snowmelt.set_state(state.snowmelt_enabled)
-        self.btn_dhw.set_state(state.dhw_enabled)
-        self.btn_eco.set_state(state.eco_enabled)
+        if enabled != prev_enabled:
+            self.btn_snowmelt.set_state(state.snowmelt_enabled)
+            self.btn_dhw.set_state(state.dhw_enabled)
+            self.btn_eco.set_state(state.eco_enabled)
         
         # Update temperatures
-        glycol_sp = state.glycol_setpoints
-        self.temp_glycol_return.set_value(
-            state.glycol_return_temp,
-            StyleSheet.temp_display(state.glycol_return_temp, glycol_sp.high_temp, glycol_sp.low_temp)
-        )
-        self.temp_glycol_supply.set_value(state.glycol_supply_temp)
-        self.temp_hx_in.set_value(state.hx_in_temp)
-        self.temp_hx_out.set_value(state.hx_out_temp)
-        
-        dhw_sp = state.eco_setpoints if state.eco_active else state.dhw_setpoints
-        self.temp_dhw.set_value(
-            state.dhw_tank_temp,
-            StyleSheet.temp_display(state.dhw_tank_temp, dhw_sp.high_temp, dhw_sp.low_temp)
-        )
-        self.temp_hx_delta.set_value(state.hx_delta_t)
-
-        # Update shutdown timer display
+        if temps != prev_temps:
+            self.temp_glycol_return.set_value(
+                state.glycol_return_temp,
+                StyleSheet.temp_state(state.glycol_return_temp, glycol_sp.high_temp, glycol_sp.low_temp)
+            )
+            self.temp_glycol_supply.set_value(state.glycol_supply_temp)
+            self.temp_hx_in.set_value(state.hx_in_temp)
+            self.temp_hx_out.set_value(state.hx_out_temp)
+            self.temp_dhw.set_value(
+                state.dhw_tank_temp,
+                StyleSheet.temp_state(state.dhw_tank_temp, dhw_sp.high_temp, dhw_sp.low_temp)
+            )
+            self.temp_hx_delta.set_value(state.hx_delta_t)
+
+    def update_countdown(self, state: ControlState):
+        """Update the shutdown timer display (also driven by the 1 s tick)"""
         if state.shutdown_timer_enabled and state.shutdown_timer_end_time:
             remaining = self.control.get_shutdown_timer_remaining()
             if remaining is not None and remaining > 0:
                 hours = remaining // 3600
                 minutes = (remaining % 3600) // 60
                 seconds = remaining % 60
-                self.timer_countdown.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-                self.timer_countdown.setStyleSheet("font-size: 14px; font-weight: bold; color: #ffa94d;")
+                self._set_label(self.timer_countdown, f"{hours:02d}:{minutes:02d}:{seconds:02d}",
+                                "running")
                 self.btn_timer_start.setEnabled(False)
                 self.btn_timer_cancel.setEnabled(True)
             else:
-                self.timer_countdown.setText("Expired")
-                self.timer_countdown.setStyleSheet("font-size: 14px; font-weight: bold; color: #51cf66;")
+                self._set_label(self.timer_countdown, "Expired", "expired")
         else:
-            self.timer_countdown.setText("Not Active")
-            self.timer_countdown.setStyleSheet("font-size: 14px; font-weight: bold; color: #adb5bd;")
+            self._set_label(self.timer_countdown, "Not Active", "off")
             self.btn_timer_start.setEnabled(True)
             self.btn_timer_cancel.setEnabled(False)
 
-        # Update time
-        now = datetime.now()
-        self.time_label.setText(now.strftime("%H:%M:%S   %Y-%m-%d"))
+    def update_clock(self):
+        """Update the time display (kept current even while the tab is hidden)"""
+        t = QTime.currentTime()
+        sec = t.second()
+        if sec == self._last_sec:
+            return
+        self._last_sec = sec
+        # The date only changes at midnight, so rebuild it during the first minute
+        if self._last_date_str is None or (t.hour() == 0 and t.minute() == 0):
+            self._last_date_str = QDate.currentDate().toString("yyyy-MM-dd")
+        self.time_label.setText(f"{t.toString('HH:mm:ss')}   {self._last_date_str}")
 
     def update_connectivity(self, mqtt_connected: bool, net_connected: bool):
         """Update the connectivity status indicators"""
@@ -1001,11 +1002,44 @@ class SetpointsTab(QWidget):
     system_toggled = pyqtSignal(str, bool)
     eco_schedule_changed = pyqtSignal(str, str)
     shutdown_requested = pyqtSignal()
+
+    # Shared rules for labels created with _mk_label, parsed once for the tab
+    LABEL_STYLE = """
+        QLabel[cls="info"] {
+            font-size: 12px;
+            color: #adb5bd;
+        }
+        QLabel[cls="readonly"] {
+            background-color: #16213e;
+            border: 1px solid #3d3d5c;
+            border-radius: 4px;
+            padding: 4px 8px;
+            color: #adb5bd;
+            font-size: 12px;
+        }
+    """
     
     def __init__(self, control: ControlLogic):
         super().__init__()
         self.control = control
+        self.setStyleSheet(self.LABEL_STYLE)
+        # Latest (high, delta) per system, sent together once edits settle
+        self._pending: Dict[str, tuple] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(SETPOINT_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_setpoints)
+        self._last_state: Optional[ControlState] = None
+        self._last_key: Optional[tuple] = None  # Setpoint values last shown
+        self._last_eco_times = ("", "")  # (start, end) strings last applied
         self._setup_ui()
+
+    @staticmethod
+    def _mk_label(text: str, cls: str = "info") -> QLabel:
+        """Create a label styled by the tab-level LABEL_STYLE rules"""
+        label = QLabel(text)
+        label.setProperty("cls", cls)
+        return label
     
     def _setup_ui(self):
         # Use grid layout: left column (Snowmelt, DHW, System stacked), right column (Eco Mode)
@@ -1023,79 +1057,51 @@ class SetpointsTab(QWidget):
 
         # Snowmelt group
         snowmelt_group = QGroupBox("Snowmelt")
-        snowmelt_layout = QVBoxLayout(snowmelt_group)
+        snowmelt_layout = QFormLayout(snowmelt_group)
         snowmelt_layout.setContentsMargins(8, 8, 8, 8)
         snowmelt_layout.setSpacing(6)
+        snowmelt_layout.setLabelAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
         self.btn_snowmelt = SystemEnableButton("snowmelt", "Enable Snowmelt")
         self.btn_snowmelt.toggled_state.connect(lambda s, e: self.system_toggled.emit(s, e))
-        snowmelt_layout.addWidget(self.btn_snowmelt)
+        snowmelt_layout.addRow(self.btn_snowmelt)
 
-        # High setpoint
-        high_row = QHBoxLayout()
-        high_label = QLabel("High:")
-        high_label.setFixedWidth(50)
-        high_label.setStyleSheet("font-size: 14px;")
         self.glycol_high = TouchSpinBox(50, 90, " °F", 5.0)
         self.glycol_high.valueChanged.connect(self._on_glycol_changed)
-        high_row.addWidget(high_label)
-        high_row.addWidget(self.glycol_high)
-        snowmelt_layout.addLayout(high_row)
-
-        # Delta setpoint
-        delta_row = QHBoxLayout()
-        delta_label = QLabel("Delta:")
-        delta_label.setFixedWidth(45)
-        delta_label.setStyleSheet("font-size: 13px;")
+        snowmelt_layout.addRow("High:", self.glycol_high)
+
         self.glycol_delta = TouchSpinBox(5, 30, " °F", 1.0)
         self.glycol_delta.valueChanged.connect(self._on_glycol_changed)
-        delta_row.addWidget(delta_label)
-        delta_row.addWidget(self.glycol_delta)
-        snowmelt_layout.addLayout(delta_row)
+        snowmelt_layout.addRow("Delta:", self.glycol_delta)
 
-        self.glycol_low_label = QLabel("Low: --")
-        self.glycol_low_label.setStyleSheet("color: #adb5bd; font-size: 12px;")
+        self.glycol_low_label = self._mk_label("Low: --")
         self.glycol_low_label.setAlignment(Qt.AlignCenter)
-        snowmelt_layout.addWidget(self.glycol_low_label)
+        snowmelt_layout.addRow(self.glycol_low_label)
 
         top_row.addWidget(snowmelt_group)
 
         # DHW group
         dhw_group = QGroupBox("DHW")
-        dhw_layout = QVBoxLayout(dhw_group)
+        dhw_layout = QFormLayout(dhw_group)
         dhw_layout.setContentsMargins(8, 8, 8, 8)
         dhw_layout.setSpacing(6)
+        dhw_layout.setLabelAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
         self.btn_dhw = SystemEnableButton("dhw", "Enable DHW")
         self.btn_dhw.toggled_state.connect(lambda s, e: self.system_toggled.emit(s, e))
-        dhw_layout.addWidget(self.btn_dhw)
+        dhw_layout.addRow(self.btn_dhw)
 
-        # High setpoint
-        high_row = QHBoxLayout()
-        high_label = QLabel("High:")
-        high_label.setFixedWidth(50)
-        high_label.setStyleSheet("font-size: 14px;")
         self.dhw_high = TouchSpinBox(100, 160, " °F", 5.0)
         self.dhw_high.valueChanged.connect(self._on_dhw_changed)
-        high_row.addWidget(high_label)
-        high_row.addWidget(self.dhw_high)
-        dhw_layout.addLayout(high_row)
-
-        # Delta setpoint
-        delta_row = QHBoxLayout()
-        delta_label = QLabel("Delta:")
-        delta_label.setFixedWidth(45)
-        delta_label.setStyleSheet("font-size: 13px;")
+        dhw_layout.addRow("High:", self.dhw_high)
+
         self.dhw_delta = TouchSpinBox(5, 20, " °F", 1.0)
         self.dhw_delta.valueChanged.connect(self._on_dhw_changed)
-        delta_row.addWidget(delta_label)
-        delta_row.addWidget(self.dhw_delta)
-        dhw_layout.addLayout(delta_row)
+        dhw_layout.addRow("Delta:", self.dhw_delta)
 
-        self.dhw_low_label = QLabel("Low: --")
-        self.dhw_low_label.setStyleSheet("color: #adb5bd; font-size: 12px;")
+        self.dhw_low_label = self._mk_label("Low: --")
         self.dhw_low_label.setAlignment(Qt.AlignCenter)
-        dhw_layout.addWidget(self.dhw_low_label)
+        dhw_layout.addRow(self.dhw_low_label)
 
         top_row.addWidget(dhw_group)
 
@@ -1131,26 +1137,14 @@ class SetpointsTab(QWidget):
         self.btn_shutdown.clicked.connect(self._on_shutdown_clicked)
         system_layout.addWidget(self.btn_shutdown)
 
-        # Read-only info style
-        readonly_style = """
-            background-color: #16213e;
-            border: 1px solid #3d3d5c;
-            border-radius: 4px;
-            padding: 4px 8px;
-            color: #adb5bd;
-            font-size: 12px;
-        """
-
         # MQTT Host field
         mqtt_frame = QFrame()
         mqtt_frame.setStyleSheet("background-color: transparent;")
         mqtt_layout_inner = QHBoxLayout(mqtt_frame)
         mqtt_layout_inner.setContentsMargins(0, 0, 0, 0)
         mqtt_layout_inner.setSpacing(6)
-        mqtt_label = QLabel("MQTT:")
-        mqtt_label.setStyleSheet("font-size: 12px; color: #adb5bd;")
-        self.mqtt_host_value = QLabel("--")
-        self.mqtt_host_value.setStyleSheet(readonly_style)
+        mqtt_label = self._mk_label("MQTT:")
+        self.mqtt_host_value = self._mk_label("--", "readonly")
         mqtt_layout_inner.addWidget(mqtt_label)
         mqtt_layout_inner.addWidget(self.mqtt_host_value)
         system_layout.addWidget(mqtt_frame)
@@ -1161,10 +1155,8 @@ class SetpointsTab(QWidget):
         ip_layout_inner = QHBoxLayout(ip_frame)
         ip_layout_inner.setContentsMargins(0, 0, 0, 0)
         ip_layout_inner.setSpacing(6)
-        ip_label = QLabel("IP:")
-        ip_label.setStyleSheet("font-size: 12px; color: #adb5bd;")
-        self.rpi_ip_value = QLabel(get_local_ip())
-        self.rpi_ip_value.setStyleSheet(readonly_style)
+        ip_label = self._mk_label("IP:")
+        self.rpi_ip_value = self._mk_label(get_local_ip(), "readonly")
         ip_layout_inner.addWidget(ip_label)
         ip_layout_inner.addWidget(self.rpi_ip_value)
         system_layout.addWidget(ip_frame)
@@ -1175,59 +1167,30 @@ class SetpointsTab(QWidget):
 
         # --- Right column: Eco Mode ---
         eco_group = QGroupBox("Eco Mode")
-        eco_layout = QVBoxLayout(eco_group)
+        eco_layout = QFormLayout(eco_group)
         eco_layout.setContentsMargins(8, 8, 8, 8)
         eco_layout.setSpacing(6)
+        eco_layout.setLabelAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
         self.btn_eco = SystemEnableButton("eco", "Enable Eco Mode")
         self.btn_eco.toggled_state.connect(lambda s, e: self.system_toggled.emit(s, e))
-        eco_layout.addWidget(self.btn_eco)
+        eco_layout.addRow(self.btn_eco)
 
-        # High setpoint
-        high_row = QHBoxLayout()
-        high_label = QLabel("High:")
-        high_label.setFixedWidth(45)
-        high_label.setStyleSheet("font-size: 13px;")
         self.eco_high = TouchSpinBox(100, 130, " °F", 1.0)
         self.eco_high.valueChanged.connect(self._on_eco_changed)
-        high_row.addWidget(high_label)
-        high_row.addWidget(self.eco_high)
-        eco_layout.addLayout(high_row)
-
-        # Delta setpoint
-        delta_row = QHBoxLayout()
-        delta_label = QLabel("Delta:")
-        delta_label.setFixedWidth(45)
-        delta_label.setStyleSheet("font-size: 13px;")
+        eco_layout.addRow("High:", self.eco_high)
+
         self.eco_delta = TouchSpinBox(5, 25, " °F", 1.0)
         self.eco_delta.valueChanged.connect(self._on_eco_changed)
-        delta_row.addWidget(delta_label)
-        delta_row.addWidget(self.eco_delta)
-        eco_layout.addLayout(delta_row)
-
-        # Start time
-        start_row = QHBoxLayout()
-        start_label = QLabel("Start:")
-        start_label.setFixedWidth(45)
-        start_label.setStyleSheet("font-size: 13px;")
+        eco_layout.addRow("Delta:", self.eco_delta)
+
         self.eco_start = TouchTimeEdit()
         self.eco_start.timeChanged.connect(self._on_eco_schedule_changed)
-        start_row.addWidget(start_label)
-        start_row.addWidget(self.eco_start)
-        eco_layout.addLayout(start_row)
-
-        # End time
-        end_row = QHBoxLayout()
-        end_label = QLabel("End:")
-        end_label.setFixedWidth(45)
-        end_label.setStyleSheet("font-size: 13px;")
+        eco_layout.addRow("Start:", self.eco_start)
+
         self.eco_end = TouchTimeEdit()
         self.eco_end.timeChanged.connect(self._on_eco_schedule_changed)
-        end_row.addWidget(end_label)
-        end_row.addWidget(self.eco_end)
-        eco_layout.addLayout(end_row)
-
-        eco_layout.addStretch()
+        eco_layout.addRow("End:", self.eco_end)
 
         # Add to grid: left column spans rows, eco on right
         layout.addLayout(left_column, 0, 0)
@@ -1239,64 +1202,142 @@ class SetpointsTab(QWidget):
         """Emit shutdown request signal"""
         self.shutdown_requested.emit()
 
+    @staticmethod
+    def _set_low_label(label: QLabel, high: float, delta: float):
+        """Show the low setpoint derived from high and delta"""
+        text = f"Low: {high - delta:.1f} °F"
+        if label.text() != text:
+            label.setText(text)
+
     def _on_glycol_changed(self):
         high = self.glycol_high.value()
         delta = self.glycol_delta.value()
-        low = high - delta
-        self.glycol_low_label.setText(f"Low: {low:.1f} °F")
-        self.setpoint_changed.emit("glycol", high, delta)
+        self._set_low_label(self.glycol_low_label, high, delta)
+        self._queue_setpoint("glycol", high, delta)
     
     def _on_dhw_changed(self):
         high = self.dhw_high.value()
         delta = self.dhw_delta.value()
-        low = high - delta
-        self.dhw_low_label.setText(f"Low: {low:.1f} °F")
-        self.setpoint_changed.emit("dhw", high, delta)
+        self._set_low_label(self.dhw_low_label, high, delta)
+        self._queue_setpoint("dhw", high, delta)
     
     def _on_eco_changed(self):
-        self.setpoint_changed.emit("eco", self.eco_high.value(), self.eco_delta.value())
+        self._queue_setpoint("eco", self.eco_high.value(), self.eco_delta.value())
+
+    def _queue_setpoint(self, system: str, high: float, delta: float):
+        """Coalesce rapid edits; each tap restarts the flush timer"""
+        self._pending[system] = (high, delta)
+        self._flush_timer.start()
+
+    def _flush_setpoints(self):
+        """Emit one setpoint_changed per system edited since the last flush"""
+        pending, self._pending = self._pending, {}
+        for system, (high, delta) in pending.items():
+            self.setpoint_changed.emit(system, high, delta)
     
     def _on_eco_schedule_changed(self):
         start = self.eco_start.time().toString("HH:mm")
         end = self.eco_end.time().toString("HH:mm")
         self.eco_schedule_changed.emit(start, end)
     
+    @staticmethod
+    def _set_spin(spin: TouchSpinBox, value: float):
+        """Set a spinbox value with signals blocked, skipping no-op updates"""
+        if spin.value() != value:
+            with QSignalBlocker(spin):
+                spin.setValue(value)
+
+    @staticmethod
+    def _set_time(edit: TouchTimeEdit, time_str: str):
+        """Set an "HH:mm" time with signals blocked, skipping no-op updates"""
+        time = QTime.fromString(time_str, "HH:mm")
+        if edit.time() != time:
+            with QSignalBlocker(edit):
+                edit.setTime(time)
+
     def update_display(self, state: ControlState):
-        # Block signals to avoid feedback loops
-        widgets = [self.glycol_high, self.glycol_delta, self.dhw_high, self.dhw_delta,
-                   self.eco_high, self.eco_delta, self.eco_start, self.eco_end]
-        for widget in widgets:
-            widget.blockSignals(True)
-        
-        self.btn_snowmelt.set_state(state.snowmelt_enabled)
-        self.btn_dhw.set_state(state.dhw_enabled)
-        self.btn_eco.set_state(state.eco_enabled)
-        
-        self.glycol_high.setValue(state.glycol_setpoints.high_temp)
-        self.glycol_delta.setValue(state.glycol_setpoints.delta_t)
-        self.glycol_low_label.setText(f"Low: {state.glycol_setpoints.low_temp:.1f} °F")
-        
-        self.dhw_high.setValue(state.dhw_setpoints.high_temp)
-        self.dhw_delta.setValue(state.dhw_setpoints.delta_t)
-        self.dhw_low_label.setText(f"Low: {state.dhw_setpoints.low_temp:.1f} °F")
-        
-        self.eco_high.setValue(state.eco_setpoints.high_temp)
-        self.eco_delta.setValue(state.eco_setpoints.delta_t)
-        
-        self.eco_start.setTime(QTime.fromString(state.eco_start, "HH:mm"))
-        self.eco_end.setTime(QTime.fromString(state.eco_end, "HH:mm"))
-        
-        # Unblock signals
-        for widget in widgets:
-            widget.blockSignals(False)
+        # Same snapshot as last time, or nothing shown on this tab changed
+        if state is self._last_state:
+            return
+        self._last_state = state
+        key = (
+            state.snowmelt_enabled, state.dhw_enabled, state.eco_enabled,
+            state.glycol_setpoints.high_temp, state.glycol_setpoints.delta_t,
+            state.dhw_setpoints.high_temp, state.dhw_setpoints.delta_t,
+            state.eco_setpoints.high_temp, state.eco_setpoints.delta_t,
+            state.eco_start, state.eco_end,
+        )
+        if key == self._last_key:
+            return
+        self._last_key = key
+
+        # Defer repaints until all the values below are in place
+        self.setUpdatesEnabled(False)
+        try:
+            self.btn_snowmelt.set_state(state.snowmelt_enabled)
+            self.btn_dhw.set_state(state.dhw_enabled)
+            self.btn_eco.set_state(state.eco_enabled)
+
+            self._set_spin(self.glycol_high, state.glycol_setpoints.high_temp)
+            self._set_spin(self.glycol_delta, state.glycol_setpoints.delta_t)
+            self._set_low_label(self.glycol_low_label,
+                                state.glycol_setpoints.high_temp, state.glycol_setpoints.delta_t)
+
+            self._set_spin(self.dhw_high, state.dhw_setpoints.high_temp)
+            self._set_spin(self.dhw_delta, state.dhw_setpoints.delta_t)
+            self._set_low_label(self.dhw_low_label,
+                                state.dhw_setpoints.high_temp, state.dhw_setpoints.delta_t)
+
+            self._set_spin(self.eco_high, state.eco_setpoints.high_temp)
+            self._set_spin(self.eco_delta, state.eco_setpoints.delta_t)
+
+            # The schedule strings rarely change, so only parse them when they do
+            eco_times = (state.eco_start, state.eco_end)
+            if eco_times != self._last_eco_times:
+                self._last_eco_times = eco_times
+                self._set_time(self.eco_start, state.eco_start)
+                self._set_time(self.eco_end, state.eco_end)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def set_mqtt_host(self, host: str):
         """Set the MQTT host display value"""
-        self.mqtt_host_value.setText(host)
+        if self.mqtt_host_value.text() != host:
+            self.mqtt_host_value.setText(host)
 
     def update_ip_address(self):
         """Update the RPi IP address display"""
-        self.rpi_ip_value.setText(get_local_ip())
+        ip = get_local_ip()
+        if self.rpi_ip_value.text() != ip:
+            self.rpi_ip_value.setText(ip)
+
+
+class _StateBridge(QObject):
+    """Carries ControlLogic state-change callbacks onto the GUI thread
+
+    ControlLogic stays free of Qt: its callback runs on whichever thread
+    changed the state and only emits state_changed, which reaches the GUI
+    thread through a queued connection.
+    """
+
+    state_changed = pyqtSignal(object, object)  # ControlState, Dict[str, RelayState]
+
+    def __init__(self, control: ControlLogic, parent: QObject = None):
+        super().__init__(parent)
+        self.control = control
+        control.set_on_state_change(self._on_state_change)
+
+    def _on_state_change(self, state: ControlState):
+        try:
+            relay_states = self.control.relays.get_all_states()
+        except Exception as e:
+            logger.error(f"Error reading relay states for display: {e}")
+            return
+        self.state_changed.emit(state, relay_states)
+
+    def detach(self):
+        """Stop receiving callbacks (before the window goes away)"""
+        self.control.set_on_state_change(None)
 
 
 class MainWindow(QMainWindow):
@@ -1306,23 +1347,35 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.control = control
         self._mqtt_integration = None  # Optional MQTT integration reference
-        self._updating = False  # Flag to prevent overlapping updates
+        self._mqtt_host: Optional[str] = None  # Shown once the settings tab exists
+        self._last_conn = (None, None)  # Last (mqtt, network) status shown
+        self._last_state: Optional[ControlState] = None  # Replayed on tab switch
+        self._last_relays: Dict[str, RelayState] = {}
         self._setup_ui()
         self._connect_signals()
 
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_display)
-        self.update_timer.start(500)  # Faster updates (500ms) since reads are now non-blocking
+        # State is pushed by ControlLogic whenever it changes; the tick timer
+        # only drives the clock, countdown and connectivity indicators
+        self._bridge = _StateBridge(self.control, self)
+        self._bridge.state_changed.connect(self._apply_state, Qt.QueuedConnection)
+        QApplication.instance().aboutToQuit.connect(self._bridge.detach)
+        self._apply_state(self.control.get_state(), self.control.relays.get_all_states())
+
+        self.tick_timer = QTimer(self)
+        self.tick_timer.timeout.connect(self._on_tick)
+        self.tick_timer.start(TICK_INTERVAL_MS)
+        self._on_tick()
 
     def set_mqtt_integration(self, mqtt_integration):
         """Set the MQTT integration reference for status monitoring"""
         self._mqtt_integration = mqtt_integration
         if mqtt_integration:
-            self.setpoints_tab.set_mqtt_host(mqtt_integration.broker)
+            self._mqtt_host = mqtt_integration.broker
+            if self.setpoints_tab is not None:
+                self.setpoints_tab.set_mqtt_host(self._mqtt_host)
     
     def _setup_ui(self):
         self.setWindowTitle("Snowmelt Control System")
-        self.setStyleSheet(StyleSheet.MAIN)
         
         # Fullscreen with no window decorations
         self.setWindowFlags(Qt.FramelessWindowHint)
@@ -1338,23 +1391,57 @@ class MainWindow(QMainWindow):
         # Create tab widget with equal-width tabs
         self.tabs = QTabWidget()
         self.tabs.setTabBar(EqualTabBar())
+        self._active_tab_idx = DASHBOARD_TAB
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         self.dashboard_tab = DashboardTab(self.control)
         self.equipment_tab = EquipmentTab(self.control)
-        self.setpoints_tab = SetpointsTab(self.control)
+        # SetpointsTab is built into this container the first time it is shown
+        self.setpoints_tab: Optional[SetpointsTab] = None
+        self._setpoints_page = QWidget()
+        QVBoxLayout(self._setpoints_page).setContentsMargins(0, 0, 0, 0)
         
         self.tabs.addTab(self.dashboard_tab, "Dashboard")
         self.tabs.addTab(self.equipment_tab, "Equipment")
-        self.tabs.addTab(self.setpoints_tab, "Settings")
+        self.tabs.addTab(self._setpoints_page, "Settings")
         
         layout.addWidget(self.tabs)
     
-    def _connect_signals(self):
-        self.equipment_tab.mode_changed.connect(self._on_equipment_mode_changed)
+    def _on_tab_changed(self, index: int):
+        self._active_tab_idx = index
+        # Hidden tabs are skipped on each tick, so bring the new one up to date now
+        try:
+            if index == SETTINGS_TAB and self.setpoints_tab is None:
+                self._create_setpoints_tab()
+            self._refresh_tab(index)
+        except Exception as e:
+            logger.error(f"Error refreshing tab: {e}")
+
+    def _refresh_tab(self, index: int):
+        """Apply the last fetched state to a single tab"""
+        if self._last_state is None:
+            return
+        if index == DASHBOARD_TAB:
+            self.dashboard_tab.update_display(self._last_state)
+        elif index == EQUIPMENT_TAB:
+            self.equipment_tab.update_display(self._last_relays)
+        elif index == SETTINGS_TAB:
+            self.setpoints_tab.update_display(self._last_state)
+            self.setpoints_tab.update_ip_address()
+
+    def _create_setpoints_tab(self):
+        """Build the settings tab on first use and wire it up"""
+        self.setpoints_tab = SetpointsTab(self.control)
         self.setpoints_tab.setpoint_changed.connect(self._on_setpoint_changed)
         self.setpoints_tab.system_toggled.connect(self._on_system_toggled)
         self.setpoints_tab.eco_schedule_changed.connect(self._on_eco_schedule_changed)
         self.setpoints_tab.shutdown_requested.connect(self._on_shutdown_requested)
+        if self._mqtt_host is not None:
+            self.setpoints_tab.set_mqtt_host(self._mqtt_host)
+        self._setpoints_page.layout().addWidget(self.setpoints_tab)
+
+    def _connect_signals(self):
+        self.equipment_tab.mode_changed.connect(self._on_equipment_mode_changed)
         self.dashboard_tab.system_toggled.connect(self._on_system_toggled)
         self.dashboard_tab.timer_started.connect(self._on_timer_started)
         self.dashboard_tab.timer_cancelled.connect(self._on_timer_cancelled)
@@ -1444,33 +1531,47 @@ class MainWindow(QMainWindow):
                 error_msg.setIcon(QMessageBox.Critical)
                 error_msg.exec_()
 
-    def _update_display(self):
-        # Skip if already updating (prevents queue buildup)
-        if self._updating:
+    def _apply_state(self, state: ControlState, relay_states: Dict[str, RelayState]):
+        """Apply pushed state to the widgets (runs on the GUI thread)"""
+        self._last_state = state
+        self._last_relays = relay_states
+
+        # Only the visible tab is refreshed; the others catch up when shown.
+        # Settings values are left alone while visible so edits aren't overwritten.
+        if self._active_tab_idx == SETTINGS_TAB:
             return
 
-        self._updating = True
+        # Hidden tabs don't paint, so only the visible one needs its repaints
+        # coalesced into a single paint event
+        visible = self.tabs.currentWidget()
+        visible.setUpdatesEnabled(False)
         try:
-            state = self.control.get_state()
-            relay_states = self.control.relays.get_all_states()
-
-            self.dashboard_tab.update_display(state)
-            self.equipment_tab.update_display(relay_states)
+            self._refresh_tab(self._active_tab_idx)
+        except Exception as e:
+            logger.error(f"Error updating display: {e}")
+        finally:
+            visible.setUpdatesEnabled(True)
+            visible.update()
 
-            if self.tabs.currentWidget() != self.setpoints_tab:
-                self.setpoints_tab.update_display(state)
+    def _on_tick(self):
+        """Once-a-second refresh of the time-driven parts of the display"""
+        try:
+            self.dashboard_tab.update_clock()
+            if self._active_tab_idx == DASHBOARD_TAB and self._last_state is not None:
+                self.dashboard_tab.update_countdown(self._last_state)
+            elif self._active_tab_idx == SETTINGS_TAB and self.setpoints_tab is not None:
+                # Update IP address in settings (in case it changed)
+                self.setpoints_tab.update_ip_address()
 
             # Update connectivity status indicators
             net_connected = get_network_status()
             mqtt_connected = self._mqtt_integration._connected if self._mqtt_integration else False
-            self.dashboard_tab.update_connectivity(mqtt_connected, net_connected)
-
-            # Update IP address in settings (in case it changed)
-            self.setpoints_tab.update_ip_address()
+            conn = (mqtt_connected, net_connected)
+            if conn != self._last_conn:
+                self.dashboard_tab.update_connectivity(*conn)
+                self._last_conn = conn
         except Exception as e:
             logger.error(f"Error updating display: {e}")
-        finally:
-            self._updating = False
     
     def keyPressEvent(self, event):
         """Handle key press events - ESC to exit fullscreen"""
@@ -1479,7 +1580,8 @@ class MainWindow(QMainWindow):
         super().keyPressEvent(event)
     
     def closeEvent(self, event):
-        self.update_timer.stop()
+        self.tick_timer.stop()
+        self._bridge.detach()
         event.accept()
 
 
@@ -1487,9 +1589,17 @@ def create_gui(control: ControlLogic) -> QApplication:
     """Create and return the GUI application"""
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
+
+    # Base colors come from the palette so Fusion draws them natively
+    palette = QPalette()
+    for role, color in StyleSheet.PALETTE.items():
+        palette.setColor(role, QColor(color))
+    app.setPalette(palette)
+    app.setStyleSheet(StyleSheet.load_main())
     
     # Set default font
-    font = QFont("DejaVu Sans", 11)
+    font = QFont("DejaVu Sans")
+    font.setPixelSize(13)
     app.setFont(font)
     
     window = MainWindow(control)
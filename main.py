@@ -9,21 +9,22 @@ import os
 import signal
 import logging
 import argparse
+import json
 import threading
 import time
 from pathlib import Path
-
-import yaml
+from typing import TYPE_CHECKING
 
 # Add project directory to path
 PROJECT_DIR = Path(__file__).parent.absolute()
 sys.path.insert(0, str(PROJECT_DIR))
 
-from sensors import SensorManager, MockSensorManager
-from relays import RelayManager, EquipmentMode
-from control import ControlLogic
-from mqtt_integration import MQTTIntegration
-from setpoint_persistence import SetpointPersistence
+# Application modules (and yaml, paho-mqtt, hardware backends) are imported
+# inside main() once arguments are parsed, so --help and disabled features
+# don't pay for them
+if TYPE_CHECKING:
+    from control import ControlLogic
+    from mqtt_integration import MQTTIntegration
 
 # Global references for cleanup
 app = None
@@ -32,7 +33,11 @@ relay_manager = None
 sensor_manager = None
 control_thread = None
 control = None
-shutdown_event = threading.Event()
+# Set once shutdown starts; flipped under _shutdown_cond so waiters wake promptly.
+# The condition's lock is reentrant, so the signal handler can't deadlock
+# against the main thread.
+_shutting_down = False
+_shutdown_cond = threading.Condition()
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +50,7 @@ def setup_logging(log_level: str, log_file: str = None):
     
     if log_file:
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
+        if log_dir:
             os.makedirs(log_dir, exist_ok=True)
         handlers.append(logging.FileHandler(log_file))
     
@@ -56,10 +61,60 @@ def setup_logging(log_level: str, log_file: str = None):
     )
 
 
+def _load_yaml_cached(yaml_path: str, private: bool = False):
+    """Load a YAML file, reusing a JSON sidecar cache while the YAML is unchanged
+
+    The cache records the source file's mtime and size and is ignored as soon
+    as either differs. Data that doesn't survive a JSON round trip (non-string
+    keys, dates) is never cached. Private files are only cached while the YAML
+    itself is readable by its owner alone, and their caches get mode 0600.
+    """
+    cache_path = yaml_path + ".cache.json"
+    st = os.stat(yaml_path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    # Only cache private files whose permissions keep other users out
+    use_cache = not (private and st.st_mode & 0o077)
+
+    if use_cache:
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get('source') == stamp:
+                return cached['data']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+    import yaml
+    # Use the libyaml C parser when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    with open(yaml_path, 'r') as f:
+        data = yaml.load(f, Loader=loader)
+
+    if not use_cache:
+        return data
+
+    try:
+        payload = json.dumps({'source': stamp, 'data': data})
+        if json.loads(payload)['data'] != data:
+            return data
+        tmp_path = cache_path + ".tmp"
+        mode = 0o600 if private else 0o644
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        # A .tmp left over from an interrupted run keeps its old mode
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Not caching {yaml_path}: {e}")
+
+    return data
+
+
 def load_config(config_path: str) -> dict:
     """Load configuration from YAML file"""
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    return _load_yaml_cached(config_path)
 
 
 def load_secrets(secrets_path: str) -> dict:
@@ -70,46 +125,79 @@ def load_secrets(secrets_path: str) -> dict:
             f"Copy secrets.yaml.example to secrets.yaml and configure your MQTT credentials."
         )
     
-    with open(secrets_path, 'r') as f:
-        return yaml.safe_load(f)
+    return _load_yaml_cached(secrets_path, private=True)
+
+
+def request_shutdown():
+    """Flag shutdown and wake any loop waiting on the next period"""
+    global _shutting_down
+    with _shutdown_cond:
+        _shutting_down = True
+        _shutdown_cond.notify_all()
+
+
+def _wait_for_shutdown(timeout: float) -> bool:
+    """Sleep up to timeout seconds; return True if shutdown was requested"""
+    with _shutdown_cond:
+        if not _shutting_down and timeout > 0:
+            _shutdown_cond.wait(timeout)
+        return _shutting_down
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals"""
     logger.info(f"Received signal {signum}, initiating shutdown...")
-    shutdown_event.set()
+    request_shutdown()
     
     if app:
         app.quit()
 
 
-def control_loop(control: ControlLogic, interval: float):
+def _next_deadline(deadline: float, interval: float) -> float:
+    """Advance a monotonic loop deadline by one interval
+    
+    If the loop has fallen more than a full interval behind (a slow update),
+    restart the schedule from now instead of running back-to-back to catch up.
+    """
+    deadline += interval
+    now = time.monotonic()
+    if deadline < now:
+        deadline = now
+    return deadline
+
+
+def control_loop(control: 'ControlLogic', interval: float):
     """Background control loop"""
     logger.info("Control loop started")
     
-    while not shutdown_event.is_set():
+    deadline = time.monotonic()
+    while not _shutting_down:
         try:
             control.update()
         except Exception as e:
             logger.error(f"Error in control loop: {e}")
         
-        shutdown_event.wait(interval)
+        # Sleep until the next period boundary so update() time doesn't drift the cadence
+        deadline = _next_deadline(deadline, interval)
+        _wait_for_shutdown(deadline - time.monotonic())
     
     logger.info("Control loop stopped")
 
 
-def run_headless(control: ControlLogic, mqtt: MQTTIntegration, interval: float):
+def run_headless(control: 'ControlLogic', mqtt: 'MQTTIntegration', interval: float):
     """Run in headless mode without GUI"""
     logger.info("Running in headless mode (no GUI)")
     
     try:
-        while not shutdown_event.is_set():
+        deadline = time.monotonic()
+        while not _shutting_down:
             control.update()
-            shutdown_event.wait(interval)
+            deadline = _next_deadline(deadline, interval)
+            _wait_for_shutdown(deadline - time.monotonic())
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
     finally:
-        shutdown_event.set()
+        request_shutdown()
 
 
 def main():
@@ -172,11 +260,17 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
     
     try:
+        from relays import RelayManager
+        from control import ControlLogic
+        from setpoint_persistence import SetpointPersistence
+
         # Initialize sensor manager (starts background read thread for real sensors)
         if args.mock_sensors:
+            from sensors import MockSensorManager
             logger.info("Using mock sensors for testing")
             sensor_manager = MockSensorManager(config['sensors'])
         else:
+            from sensors import SensorManager
             sensor_manager = SensorManager(config['sensors'])
 
         # Initialize relay manager
@@ -198,6 +292,7 @@ def main():
         mqtt_client = None
         if not args.no_mqtt:
             try:
+                from mqtt_integration import MQTTIntegration
                 mqtt_client = MQTTIntegration(secrets['mqtt'], control)
                 mqtt_client.connect()
                 logger.info("MQTT integration enabled")
@@ -234,7 +329,7 @@ def main():
             exit_code = app.exec_()
             
             # Signal shutdown
-            shutdown_event.set()
+            request_shutdown()
             
             sys.exit(exit_code)
             
@@ -245,7 +340,7 @@ def main():
     finally:
         # Cleanup
         logger.info("Shutting down...")
-        shutdown_event.set()
+        request_shutdown()
 
         if control:
             control.shutdown()
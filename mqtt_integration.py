@@ -5,18 +5,153 @@ Handles Home Assistant integration via MQTT with auto-discovery
 
 import json
 import logging
+import re
+import sys
 import time
 from typing import Dict, Optional, Callable
-from threading import Thread, Event
+from threading import Thread, Condition
 from dataclasses import asdict
 
 import paho.mqtt.client as mqtt
 
 from relays import EquipmentMode, RelayState
-from control import ControlState, ControlLogic
+from control import ControlState, ControlLogic, PublishSnapshot, SystemState
 
 logger = logging.getLogger(__name__)
 
+# All command topics are base/{group}/{name}/set
+_COMMAND_TOPIC_RE = re.compile(r"[^/]+/([^/]+)/([^/]+)/set")
+
+# Published state topics: (topic suffix under base_topic, ControlState attribute)
+_TEMP_TABLE = (
+    ("sensor/glycol_return", "glycol_return_temp"),
+    ("sensor/glycol_supply", "glycol_supply_temp"),
+    ("sensor/hx_in", "hx_in_temp"),
+    ("sensor/hx_out", "hx_out_temp"),
+    ("sensor/dhw_tank", "dhw_tank_temp"),
+    ("sensor/hx_delta_t", "hx_delta_t"),
+)
+
+# (topic suffix under base_topic, PublishSnapshot field)
+_SNAPSHOT_TABLE = (
+    ("system/snowmelt", "snowmelt_enabled"),
+    ("system/dhw", "dhw_enabled"),
+    ("system/eco", "eco_enabled"),
+    ("state/eco_active", "eco_active"),
+    ("state/snowmelt_state", "snowmelt_state"),
+    ("state/dhw_state", "dhw_state"),
+    ("setpoint/glycol_high", "glycol_high"),
+    ("setpoint/glycol_delta", "glycol_delta"),
+    ("setpoint/dhw_high", "dhw_high"),
+    ("setpoint/dhw_delta", "dhw_delta"),
+    ("setpoint/eco_high", "eco_high"),
+    ("setpoint/eco_delta", "eco_delta"),
+)
+
+# Shared switch payloads, so unchanged values compare by identity
+_ON = "ON"
+_OFF = "OFF"
+
+# Pre-encoded bytes for the recurring payload strings, handed straight to paho
+_PAYLOAD_CACHE: Dict[str, bytes] = {
+    value: value.encode() for value in (
+        _ON, _OFF, "unavailable",
+        *(mode.value for mode in EquipmentMode),
+        *(state.value for state in SystemState),
+    )
+}
+
+# Home Assistant discovery entities
+_DEVICE_INFO = {
+    "identifiers": ["snowmelt_control"],
+    "name": "Snowmelt Control System",
+    "model": "RPi Snowmelt Controller",
+    "manufacturer": "John Boyd",
+    "sw_version": "1.0.0"
+}
+# Serialized once and spliced into every discovery payload
+_DEVICE_JSON = json.dumps(_DEVICE_INFO, separators=(",", ":"))
+
+_DISCOVERY_SENSORS = (
+    ("glycol_return", "Glycol Return Temperature"),
+    ("glycol_supply", "Glycol Supply Temperature"),
+    ("hx_in", "Heat Exchanger In"),
+    ("hx_out", "Heat Exchanger Out"),
+    ("dhw_tank", "DHW Tank Temperature"),
+    ("hx_delta_t", "Heat Exchanger Delta T"),
+)
+
+_DISCOVERY_EQUIPMENT = (
+    ("glycol_pump", "Glycol Pump"),
+    ("primary_pump", "Primary Pump"),
+    ("bypass_valve", "Bypass Valve"),
+    ("dhw_pump", "DHW Recirculation Pump"),
+)
+
+_DISCOVERY_SYSTEMS = (
+    ("snowmelt", "Snowmelt System"),
+    ("dhw", "DHW System"),
+    ("eco", "Eco Mode"),
+)
+
+# (id, name, min, max, step)
+_DISCOVERY_SETPOINTS = (
+    ("glycol_high", "Glycol High Setpoint", 50, 90, 5),
+    ("glycol_delta", "Glycol Delta T", 5, 30, 1),
+    ("dhw_high", "DHW High Setpoint", 100, 140, 5),
+    ("dhw_delta", "DHW Delta T", 5, 20, 1),
+    ("eco_high", "Eco High Setpoint", 100, 130, 5),
+    ("eco_delta", "Eco Delta T", 5, 25, 1),
+)
+
+_DISCOVERY_STATES = (
+    ("snowmelt_state", "Snowmelt State"),
+    ("dhw_state", "DHW State"),
+    ("eco_active", "Eco Mode Active"),
+)
+
+# Discovery payload templates, filled in with str.format
+_SENSOR_CONFIG = (
+    '{{"name":"{name}","unique_id":"snowmelt_{id}",'
+    '"state_topic":"{base}/sensor/{id}","unit_of_measurement":"°F",'
+    '"device_class":"temperature","device":{device},'
+    '"availability_topic":"{base}/status"}}'
+)
+_EQUIPMENT_STATE_CONFIG = (
+    '{{"name":"{name} State","unique_id":"snowmelt_{id}_state",'
+    '"state_topic":"{base}/{id}/state","payload_on":"ON","payload_off":"OFF",'
+    '"device":{device},"availability_topic":"{base}/status"}}'
+)
+_EQUIPMENT_MODE_CONFIG = (
+    '{{"name":"{name} Mode","unique_id":"snowmelt_{id}_mode",'
+    '"state_topic":"{base}/{id}/mode","command_topic":"{base}/{id}/mode/set",'
+    '"options":["auto","on","off"],'
+    '"device":{device},"availability_topic":"{base}/status"}}'
+)
+_SYSTEM_CONFIG = (
+    '{{"name":"{name}","unique_id":"snowmelt_{id}_enabled",'
+    '"state_topic":"{base}/system/{id}","command_topic":"{base}/system/{id}/set",'
+    '"payload_on":"ON","payload_off":"OFF",'
+    '"device":{device},"availability_topic":"{base}/status"}}'
+)
+_SETPOINT_CONFIG = (
+    '{{"name":"{name}","unique_id":"snowmelt_{id}",'
+    '"state_topic":"{base}/setpoint/{id}","command_topic":"{base}/setpoint/{id}/set",'
+    '"min":{min},"max":{max},"step":{step},"unit_of_measurement":"°F",'
+    '"device":{device},"availability_topic":"{base}/status"}}'
+)
+_STATE_CONFIG = (
+    '{{"name":"{name}","unique_id":"snowmelt_{id}",'
+    '"state_topic":"{base}/state/{id}",'
+    '"device":{device},"availability_topic":"{base}/status"}}'
+)
+
+
+def _format_tenths(tenths: int) -> str:
+    """Format a temperature held in integer tenths as e.g. '72.4' or '-3.0'"""
+    whole, frac = divmod(abs(tenths), 10)
+    return f"{'-' if tenths < 0 else ''}{whole}.{frac}"
+
 
 class MQTTIntegration:
     """Manages MQTT connection and Home Assistant integration"""
@@ -34,14 +169,50 @@ class MQTTIntegration:
         
         self.client: Optional[mqtt.Client] = None
         self._connected = False
-        self._stop_event = Event()
+        self._running = False  # Publish thread runs while set; flipped under _wake
+        self._wake = Condition()  # Notified to publish before the next 5 s tick
         self._publish_thread: Optional[Thread] = None
         
         # Track last published states to avoid redundant publishes
         self._last_states: Dict[str, str] = {}
+        # Last published temperature per topic, in integer tenths of a degree
+        self._last_temp_tenths: Dict[str, Optional[int]] = {}
+        # (control, relay) state versions as of the last publish
+        self._last_version: Optional[tuple] = None
+        # (topic, payload) discovery messages, built on first connect
+        self._discovery: Optional[list] = None
+        
+        # Full topic strings for the tables above, built once
+        self._temp_topics = self._topics(_TEMP_TABLE)
+        # Snapshot topics in PublishSnapshot field order, to zip with a snapshot
+        snapshot_suffixes = {field: suffix for suffix, field in _SNAPSHOT_TABLE}
+        self._snapshot_topics = self._topics(
+            [(snapshot_suffixes[field],) for field in PublishSnapshot._fields])
+        self._relay_topics: Dict[str, tuple] = {}
+        
+        # Command handlers keyed by the topic segment after base_topic;
+        # equipment mode commands (base/{equipment}/mode/set) are the fallback
+        self._command_handlers: Dict[str, Callable[[str, str], None]] = {
+            'system': self._handle_system_command,
+            'setpoint': self._handle_setpoint_command,
+        }
+        self._system_setters: Dict[str, Callable[[bool], None]] = {
+            'snowmelt': control.set_snowmelt_enabled,
+            'dhw': control.set_dhw_enabled,
+            'eco': control.set_eco_enabled,
+        }
+        self._setpoint_setters: Dict[str, Callable[[float, float], None]] = {
+            'glycol': control.set_glycol_setpoints,
+            'dhw': control.set_dhw_setpoints,
+            'eco': control.set_eco_setpoints,
+        }
         
         logger.info(f"MQTT integration initialized for broker {self.broker}:{self.port}")
     
+    def _topics(self, table) -> list:
+        """Prefix each table entry's topic suffix with base_topic"""
+        return [sys.intern(f"{self.base_topic}/{row[0]}") for row in table]
+    
     def connect(self):
         """Connect to MQTT broker"""
         try:
@@ -66,7 +237,7 @@ class MQTTIntegration:
             self.client.loop_start()
             
             # Start publish thread
-            self._stop_event.clear()
+            self._running = True
             self._publish_thread = Thread(target=self._publish_loop, daemon=True)
             self._publish_thread.start()
             
@@ -117,25 +288,22 @@ class MQTTIntegration:
             payload = msg.payload.decode('utf-8')
             logger.debug(f"MQTT message: {topic} = {payload}")
             
-            # Parse topic structure
-            parts = topic.split('/')
-            if len(parts) < 3:
+            match = _COMMAND_TOPIC_RE.fullmatch(topic)
+            if match is None:
                 return
+            group, name = match.groups()
             
-            # Equipment mode commands: snowmelt/{equipment}/mode/set
-            if len(parts) == 4 and parts[2] == 'mode' and parts[3] == 'set':
-                equipment_id = parts[1]
-                self._handle_mode_command(equipment_id, payload)
-            
-            # System enable commands: snowmelt/system/{system}/set
-            elif len(parts) == 4 and parts[1] == 'system' and parts[3] == 'set':
-                system_name = parts[2]
-                self._handle_system_command(system_name, payload)
+            if name == 'mode':
+                # Equipment mode commands: snowmelt/{equipment}/mode/set
+                self._handle_mode_command(group, payload)
+            else:
+                # snowmelt/system/{system}/set, snowmelt/setpoint/{setpoint}/set
+                handler = self._command_handlers.get(group)
+                if handler is not None:
+                    handler(name, payload)
             
-            # Setpoint commands: snowmelt/setpoint/{setpoint}/set
-            elif len(parts) == 4 and parts[1] == 'setpoint' and parts[3] == 'set':
-                setpoint_name = parts[2]
-                self._handle_setpoint_command(setpoint_name, payload)
+            # Echo the resulting state back without waiting for the next tick
+            self._wake_publisher()
                 
         except Exception as e:
             logger.error(f"Error processing MQTT message: {e}")
@@ -153,12 +321,9 @@ class MQTTIntegration:
         """Handle system enable/disable command"""
         enabled = payload.lower() in ('on', 'true', '1', 'enable')
         
-        if system_name == 'snowmelt':
-            self.control.set_snowmelt_enabled(enabled)
-        elif system_name == 'dhw':
-            self.control.set_dhw_enabled(enabled)
-        elif system_name == 'eco':
-            self.control.set_eco_enabled(enabled)
+        setter = self._system_setters.get(system_name)
+        if setter is not None:
+            setter(enabled)
         else:
             logger.warning(f"Unknown system: {system_name}")
     
@@ -169,12 +334,9 @@ class MQTTIntegration:
             high_temp = float(data.get('high_temp', data.get('high', 0)))
             delta_t = float(data.get('delta_t', data.get('delta', 0)))
             
-            if setpoint_name == 'glycol':
-                self.control.set_glycol_setpoints(high_temp, delta_t)
-            elif setpoint_name == 'dhw':
-                self.control.set_dhw_setpoints(high_temp, delta_t)
-            elif setpoint_name == 'eco':
-                self.control.set_eco_setpoints(high_temp, delta_t)
+            setter = self._setpoint_setters.get(setpoint_name)
+            if setter is not None:
+                setter(high_temp, delta_t)
             elif setpoint_name == 'eco_schedule':
                 start = data.get('start', '22:00')
                 end = data.get('end', '06:00')
@@ -187,263 +349,131 @@ class MQTTIntegration:
     
     def _publish_discovery(self):
         """Publish Home Assistant MQTT discovery configurations"""
-        device_info = {
-            "identifiers": ["snowmelt_control"],
-            "name": "Snowmelt Control System",
-            "model": "RPi Snowmelt Controller",
-            "manufacturer": "John Boyd",
-            "sw_version": "1.0.0"
-        }
-        
-        # Temperature sensors
-        sensors = [
-            ("glycol_return", "Glycol Return Temperature", "°F"),
-            ("glycol_supply", "Glycol Supply Temperature", "°F"),
-            ("hx_in", "Heat Exchanger In", "°F"),
-            ("hx_out", "Heat Exchanger Out", "°F"),
-            ("dhw_tank", "DHW Tank Temperature", "°F"),
-            ("hx_delta_t", "Heat Exchanger Delta T", "°F"),
-        ]
-        
-        for sensor_id, name, unit in sensors:
-            config = {
-                "name": name,
-                "unique_id": f"snowmelt_{sensor_id}",
-                "state_topic": f"{self.base_topic}/sensor/{sensor_id}",
-                "unit_of_measurement": unit,
-                "device_class": "temperature" if unit == "°F" else None,
-                "device": device_info,
-                "availability_topic": f"{self.base_topic}/status"
-            }
-            config = {k: v for k, v in config.items() if v is not None}
-            
-            self.client.publish(
-                f"{self.discovery_prefix}/sensor/snowmelt/{sensor_id}/config",
-                json.dumps(config),
-                retain=True
-            )
+        # Built on first connect and replayed as one burst on every reconnect
+        if self._discovery is None:
+            self._discovery = [(topic, payload.encode())
+                               for topic, payload in self._discovery_messages()]
         
-        # Equipment switches (with mode select)
-        equipment = [
-            ("glycol_pump", "Glycol Pump"),
-            ("primary_pump", "Primary Pump"),
-            ("bypass_valve", "Bypass Valve"),
-            ("dhw_pump", "DHW Recirculation Pump"),
-        ]
+        client_publish = self.client.publish
+        for topic, payload in self._discovery:
+            client_publish(topic, payload, retain=True)
         
-        for equip_id, name in equipment:
-            # Binary sensor for actual state
-            state_config = {
-                "name": f"{name} State",
-                "unique_id": f"snowmelt_{equip_id}_state",
-                "state_topic": f"{self.base_topic}/{equip_id}/state",
-                "payload_on": "ON",
-                "payload_off": "OFF",
-                "device": device_info,
-                "availability_topic": f"{self.base_topic}/status"
-            }
-            self.client.publish(
-                f"{self.discovery_prefix}/binary_sensor/snowmelt/{equip_id}_state/config",
-                json.dumps(state_config),
-                retain=True
-            )
-            
-            # Select for mode
-            mode_config = {
-                "name": f"{name} Mode",
-                "unique_id": f"snowmelt_{equip_id}_mode",
-                "state_topic": f"{self.base_topic}/{equip_id}/mode",
-                "command_topic": f"{self.base_topic}/{equip_id}/mode/set",
-                "options": ["auto", "on", "off"],
-                "device": device_info,
-                "availability_topic": f"{self.base_topic}/status"
-            }
-            self.client.publish(
-                f"{self.discovery_prefix}/select/snowmelt/{equip_id}_mode/config",
-                json.dumps(mode_config),
-                retain=True
-            )
-        
-        # System switches
-        systems = [
-            ("snowmelt", "Snowmelt System"),
-            ("dhw", "DHW System"),
-            ("eco", "Eco Mode"),
-        ]
+        logger.info("Published Home Assistant discovery configurations")
+    
+    def _discovery_messages(self):
+        """Yield (topic, payload) for every discovery config
         
-        for sys_id, name in systems:
-            switch_config = {
-                "name": name,
-                "unique_id": f"snowmelt_{sys_id}_enabled",
-                "state_topic": f"{self.base_topic}/system/{sys_id}",
-                "command_topic": f"{self.base_topic}/system/{sys_id}/set",
-                "payload_on": "ON",
-                "payload_off": "OFF",
-                "device": device_info,
-                "availability_topic": f"{self.base_topic}/status"
-            }
-            self.client.publish(
-                f"{self.discovery_prefix}/switch/snowmelt/{sys_id}/config",
-                json.dumps(switch_config),
-                retain=True
-            )
+        Payloads are filled in from the JSON templates above, with the
+        pre-serialized device block spliced in.
+        """
+        fields = {"base": self.base_topic, "device": _DEVICE_JSON}
+        prefix = self.discovery_prefix
         
-        # Number inputs for setpoints
-        setpoints = [
-            ("glycol_high", "Glycol High Setpoint", 50, 90, 5),
-            ("glycol_delta", "Glycol Delta T", 5, 30, 1),
-            ("dhw_high", "DHW High Setpoint", 100, 140, 5),
-            ("dhw_delta", "DHW Delta T", 5, 20, 1),
-            ("eco_high", "Eco High Setpoint", 100, 130, 5),
-            ("eco_delta", "Eco Delta T", 5, 25, 1),
-        ]
+        for sensor_id, name in _DISCOVERY_SENSORS:
+            yield (f"{prefix}/sensor/snowmelt/{sensor_id}/config",
+                   _SENSOR_CONFIG.format(id=sensor_id, name=name, **fields))
         
-        for sp_id, name, min_val, max_val, step in setpoints:
-            number_config = {
-                "name": name,
-                "unique_id": f"snowmelt_{sp_id}",
-                "state_topic": f"{self.base_topic}/setpoint/{sp_id}",
-                "command_topic": f"{self.base_topic}/setpoint/{sp_id}/set",
-                "min": min_val,
-                "max": max_val,
-                "step": step,
-                "unit_of_measurement": "°F",
-                "device": device_info,
-                "availability_topic": f"{self.base_topic}/status"
-            }
-            self.client.publish(
-                f"{self.discovery_prefix}/number/snowmelt/{sp_id}/config",
-                json.dumps(number_config),
-                retain=True
-            )
+        for equip_id, name in _DISCOVERY_EQUIPMENT:
+            yield (f"{prefix}/binary_sensor/snowmelt/{equip_id}_state/config",
+                   _EQUIPMENT_STATE_CONFIG.format(id=equip_id, name=name, **fields))
+            yield (f"{prefix}/select/snowmelt/{equip_id}_mode/config",
+                   _EQUIPMENT_MODE_CONFIG.format(id=equip_id, name=name, **fields))
         
-        # System state sensors
-        state_sensors = [
-            ("snowmelt_state", "Snowmelt State"),
-            ("dhw_state", "DHW State"),
-            ("eco_active", "Eco Mode Active"),
-        ]
+        for sys_id, name in _DISCOVERY_SYSTEMS:
+            yield (f"{prefix}/switch/snowmelt/{sys_id}/config",
+                   _SYSTEM_CONFIG.format(id=sys_id, name=name, **fields))
         
-        for state_id, name in state_sensors:
-            config = {
-                "name": name,
-                "unique_id": f"snowmelt_{state_id}",
-                "state_topic": f"{self.base_topic}/state/{state_id}",
-                "device": device_info,
-                "availability_topic": f"{self.base_topic}/status"
-            }
-            self.client.publish(
-                f"{self.discovery_prefix}/sensor/snowmelt/{state_id}/config",
-                json.dumps(config),
-                retain=True
-            )
+        for sp_id, name, min_val, max_val, step in _DISCOVERY_SETPOINTS:
+            yield (f"{prefix}/number/snowmelt/{sp_id}/config",
+                   _SETPOINT_CONFIG.format(id=sp_id, name=name, min=min_val,
+                                           max=max_val, step=step, **fields))
         
-        logger.info("Published Home Assistant discovery configurations")
+        for state_id, name in _DISCOVERY_STATES:
+            yield (f"{prefix}/sensor/snowmelt/{state_id}/config",
+                   _STATE_CONFIG.format(id=state_id, name=name, **fields))
     
     def _publish_loop(self):
         """Background thread for publishing state updates"""
-        while not self._stop_event.is_set():
+        while self._running:
             if self._connected:
                 try:
                     self._publish_state()
                 except Exception as e:
                     logger.error(f"Error publishing state: {e}")
             
-            self._stop_event.wait(5)  # Publish every 5 seconds
+            # Publish every 5 seconds, or sooner when woken
+            with self._wake:
+                if self._running:
+                    self._wake.wait(timeout=5)
+    
+    def _wake_publisher(self):
+        """Wake the publish thread so it publishes immediately"""
+        with self._wake:
+            self._wake.notify()
     
     def _publish_state(self):
         """Publish current system state to MQTT"""
+        version = (self.control.state_version, self.control.relays.state_version)
+        if version == self._last_version:
+            return
+        
         state = self.control.get_state()
         relay_states = self.control.relays.get_all_states()
+        pending = []
+        last = self._last_states
+        queue = pending.append
         
-        # Publish temperatures
-        temps = {
-            'glycol_return': state.glycol_return_temp,
-            'glycol_supply': state.glycol_supply_temp,
-            'hx_in': state.hx_in_temp,
-            'hx_out': state.hx_out_temp,
-            'dhw_tank': state.dhw_tank_temp,
-            'hx_delta_t': state.hx_delta_t,
-        }
+        def publish(topic: str, value: str):
+            """Queue value for topic if it differs from the last one sent"""
+            prev = last.get(topic)
+            # Most values are the same interned/enum string as last time,
+            # so the identity check settles them without a compare
+            if prev is not value and prev != value:
+                queue((topic, value))
+                last[topic] = value
         
-        for sensor_id, temp in temps.items():
-            value = str(round(temp, 1)) if temp is not None else "unavailable"
-            self._publish_if_changed(f"{self.base_topic}/sensor/{sensor_id}", value)
+        # Publish temperatures (only formatted when the rounded value moves)
+        last_tenths = self._last_temp_tenths
+        for topic, (_, attr) in zip(self._temp_topics, _TEMP_TABLE):
+            temp = getattr(state, attr)
+            tenths = None if temp is None else round(temp * 10)
+            if topic in last_tenths and last_tenths[topic] == tenths:
+                continue
+            last_tenths[topic] = tenths
+            publish(topic, "unavailable" if tenths is None else _format_tenths(tenths))
         
         # Publish equipment states and modes
         for equip_id, relay_state in relay_states.items():
-            state_value = "ON" if relay_state.is_energized else "OFF"
-            self._publish_if_changed(f"{self.base_topic}/{equip_id}/state", state_value)
-            self._publish_if_changed(f"{self.base_topic}/{equip_id}/mode", relay_state.mode.value)
+            topics = self._relay_topics.get(equip_id)
+            if topics is None:
+                topics = self._relay_topics[equip_id] = (
+                    sys.intern(f"{self.base_topic}/{equip_id}/state"),
+                    sys.intern(f"{self.base_topic}/{equip_id}/mode"),
+                )
+            publish(topics[0], _ON if relay_state.is_energized else _OFF)
+            publish(topics[1], relay_state.mode.value)
         
-        # Publish system states
-        self._publish_if_changed(
-            f"{self.base_topic}/system/snowmelt",
-            "ON" if state.snowmelt_enabled else "OFF"
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/system/dhw",
-            "ON" if state.dhw_enabled else "OFF"
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/system/eco",
-            "ON" if state.eco_enabled else "OFF"
-        )
+        # Publish system switches, state values and setpoints
+        for topic, value in zip(self._snapshot_topics, self.control.get_publish_snapshot()):
+            publish(topic, value)
         
-        # Publish state values
-        self._publish_if_changed(
-            f"{self.base_topic}/state/snowmelt_state",
-            state.snowmelt_state.value
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/state/dhw_state",
-            state.dhw_state.value
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/state/eco_active",
-            "ON" if state.eco_active else "OFF"
-        )
+        # Send everything that changed in one burst
+        client_publish = self.client.publish
+        encoded = _PAYLOAD_CACHE.get
+        for topic, value in pending:
+            client_publish(topic, encoded(value) or value.encode(), retain=True)
         
-        # Publish setpoints
-        self._publish_if_changed(
-            f"{self.base_topic}/setpoint/glycol_high",
-            str(state.glycol_setpoints.high_temp)
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/setpoint/glycol_delta",
-            str(state.glycol_setpoints.delta_t)
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/setpoint/dhw_high",
-            str(state.dhw_setpoints.high_temp)
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/setpoint/dhw_delta",
-            str(state.dhw_setpoints.delta_t)
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/setpoint/eco_high",
-            str(state.eco_setpoints.high_temp)
-        )
-        self._publish_if_changed(
-            f"{self.base_topic}/setpoint/eco_delta",
-            str(state.eco_setpoints.delta_t)
-        )
-    
-    def _publish_if_changed(self, topic: str, value: str):
-        """Only publish if value has changed"""
-        if self._last_states.get(topic) != value:
-            self.client.publish(topic, value, retain=True)
-            self._last_states[topic] = value
+        self._last_version = version
     
     def publish_now(self):
-        """Force immediate state publish"""
-        if self._connected:
-            self._publish_state()
+        """Force immediate state publish (on the publish thread)"""
+        self._wake_publisher()
     
     def disconnect(self):
         """Disconnect from MQTT broker"""
-        self._stop_event.set()
+        with self._wake:
+            self._running = False
+            self._wake.notify_all()
         
         if self.client:
             self.client.publish(f"{self.base_topic}/status", "offline", retain=True)
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from threading import Lock
 import time
 
+from compat import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
 # Try to import RPi.GPIO, fall back to mock for development
@@ -28,7 +30,7 @@ class EquipmentMode(Enum):
     OFF = "off"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RelayState:
     """Current state of a relay"""
     relay_num: int
@@ -59,7 +61,15 @@ class RelayController:
     # Some relay HATs are active-low (relay on when GPIO low)
     ACTIVE_LOW = False
     
-    def __init__(self, relay_num: int, name: str, description: str = ""):
+    # Desired relay state per mode, given what auto mode wants
+    _MODE_TO_STATE = {
+        EquipmentMode.ON: lambda auto_state: True,
+        EquipmentMode.OFF: lambda auto_state: False,
+        EquipmentMode.AUTO: lambda auto_state: auto_state,
+    }
+    
+    def __init__(self, relay_num: int, name: str, description: str = "",
+                 lock: Optional[Lock] = None):
         self.relay_num = relay_num
         self.name = name
         self.description = description
@@ -68,7 +78,9 @@ class RelayController:
         self._mode = EquipmentMode.AUTO
         self._auto_state = False
         self._is_energized = False
-        self._lock = Lock()
+        self._version = 0  # Bumped after any RelayState field changes
+        # Serializes writers; RelayManager shares one lock across all its relays
+        self._lock = lock if lock is not None else Lock()
         self._on_change_callback: Optional[Callable] = None
         
         if self.gpio_pin is None:
@@ -76,6 +88,10 @@ class RelayController:
         
         # Initialize GPIO if available
         if GPIO_AVAILABLE:
+            # Output levels for energized/de-energized (handles active-low HATs)
+            self._on_level = GPIO.LOW if self.ACTIVE_LOW else GPIO.HIGH
+            self._off_level = GPIO.HIGH if self.ACTIVE_LOW else GPIO.LOW
+            self._gpio_output = GPIO.output
             GPIO.setup(self.gpio_pin, GPIO.OUT)
             self._set_physical_state(False)
         
@@ -84,13 +100,14 @@ class RelayController:
     def _set_physical_state(self, energize: bool):
         """Set the physical relay state"""
         if GPIO_AVAILABLE:
-            # Handle active-low logic
-            if self.ACTIVE_LOW:
-                GPIO.output(self.gpio_pin, GPIO.LOW if energize else GPIO.HIGH)
-            else:
-                GPIO.output(self.gpio_pin, GPIO.HIGH if energize else GPIO.LOW)
+            self._gpio_output(self.gpio_pin, self._on_level if energize else self._off_level)
         
+        changed = energize != self._is_energized
+        # State first, then version, so get_all_states never caches an old
+        # value under a new version
         self._is_energized = energize
+        if changed:
+            self._version += 1
         logger.debug(f"Relay {self.name}: {'ON' if energize else 'OFF'}")
     
     def set_mode(self, mode: EquipmentMode):
@@ -98,36 +115,59 @@ class RelayController:
         with self._lock:
             old_mode = self._mode
             self._mode = mode
-            self._update_state()
+            switched = self._update_state()
             
             if old_mode != mode:
+                self._version += 1
                 logger.info(f"{self.name} mode changed: {old_mode.value} -> {mode.value}")
-                if self._on_change_callback:
-                    self._on_change_callback(self)
+        
+        # One notification covers both the mode change and any switching.
+        # Called outside the lock, which RelayManager shares across relays.
+        if (switched or old_mode != mode) and self._on_change_callback:
+            self._on_change_callback(self)
     
     def set_auto_state(self, state: bool):
         """Set what the auto mode wants the relay to be"""
         with self._lock:
             old_auto = self._auto_state
             self._auto_state = state
-            self._update_state()
+            switched = self._update_state()
+            
+            if old_auto != state:
+                self._version += 1
             
             if old_auto != state and self._mode == EquipmentMode.AUTO:
                 logger.info(f"{self.name} auto state: {'ON' if state else 'OFF'}")
+        
+        if switched and self._on_change_callback:
+            self._on_change_callback(self)
     
-    def _update_state(self):
-        """Update physical relay based on mode and auto state"""
-        if self._mode == EquipmentMode.ON:
-            new_state = True
-        elif self._mode == EquipmentMode.OFF:
-            new_state = False
-        else:  # AUTO
-            new_state = self._auto_state
+    def _update_state(self) -> bool:
+        """Update physical relay based on mode and auto state
         
-        if new_state != self._is_energized:
-            self._set_physical_state(new_state)
-            if self._on_change_callback:
-                self._on_change_callback(self)
+        Returns True if the relay switched. Callers fire the change callback.
+        """
+        new_state = self._MODE_TO_STATE[self._mode](self._auto_state)
+        
+        if new_state == self._is_energized:
+            return False
+        self._set_physical_state(new_state)
+        return True
+    
+    def _mark_forced_off(self) -> bool:
+        """Record an OFF already written to the pin by RelayManager.emergency_off
+        
+        Caller holds the (shared) relay lock and fires the change callback
+        after releasing it. Returns True if anything changed.
+        """
+        changed = (self._mode != EquipmentMode.OFF or self._auto_state
+                   or self._is_energized)
+        self._mode = EquipmentMode.OFF
+        self._auto_state = False
+        self._is_energized = False
+        if changed:
+            self._version += 1
+        return changed
     
     def set_on_change_callback(self, callback: Callable):
         """Set callback for state changes"""
@@ -145,17 +185,21 @@ class RelayController:
     def auto_state(self) -> bool:
         return self._auto_state
     
+    @property
+    def version(self) -> int:
+        """Change counter for the values reported by get_state()"""
+        return self._version
+    
     def get_state(self) -> RelayState:
-        """Get current relay state"""
-        with self._lock:
-            return RelayState(
-                relay_num=self.relay_num,
-                name=self.name,
-                mode=self._mode,
-                is_energized=self._is_energized,
-                auto_state=self._auto_state,
-                description=self.description
-            )
+        """Get current relay state (lock-free; each field read is atomic)"""
+        return RelayState(
+            relay_num=self.relay_num,
+            name=self.name,
+            mode=self._mode,
+            is_energized=self._is_energized,
+            auto_state=self._auto_state,
+            description=self.description
+        )
 
 
 class RelayManager:
@@ -163,7 +207,8 @@ class RelayManager:
     
     def __init__(self, relay_config: Dict):
         self.relays: Dict[str, RelayController] = {}
-        self._lock = Lock()
+        self._lock = Lock()  # One writer lock shared by every relay
+        self._snapshot: Optional[tuple] = None  # (state_version, get_all_states() dict)
         
         # Initialize GPIO
         if GPIO_AVAILABLE:
@@ -175,7 +220,8 @@ class RelayManager:
             self.relays[relay_id] = RelayController(
                 relay_num=config['relay'],
                 name=config['name'],
-                description=config.get('description', '')
+                description=config.get('description', ''),
+                lock=self._lock
             )
     
     def get_relay(self, relay_id: str) -> Optional[RelayController]:
@@ -195,23 +241,49 @@ class RelayManager:
             relay.set_auto_state(state)
     
     def get_all_states(self) -> Dict[str, RelayState]:
-        """Get states of all relays"""
+        """Get states of all relays (shared snapshot; treat as read-only)"""
+        # Read the version before the relays so a racing change can only
+        # make the snapshot newer than its tag, never older (relies on writers
+        # updating a relay's fields before bumping its version)
+        version = self.state_version
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == version:
+            return snapshot[1]
+        
         states = {}
         for relay_id, relay in self.relays.items():
             states[relay_id] = relay.get_state()
+        self._snapshot = (version, states)
         return states
     
+    @property
+    def state_version(self) -> int:
+        """Changes whenever any relay's state changes"""
+        return sum(relay.version for relay in self.relays.values())
+    
     def set_on_change_callback(self, callback: Callable):
         """Set callback for all relay changes"""
         for relay in self.relays.values():
             relay.set_on_change_callback(callback)
     
+    def emergency_off(self):
+        """Force every relay OFF together with a single batched GPIO write"""
+        with self._lock:
+            relays = list(self.relays.values())
+            if GPIO_AVAILABLE:
+                GPIO.output([relay.gpio_pin for relay in relays],
+                            [relay._off_level for relay in relays])
+            changed = [relay for relay in relays if relay._mark_forced_off()]
+        
+        for relay in changed:
+            if relay._on_change_callback:
+                relay._on_change_callback(relay)
+        logger.info("All relays forced OFF")
+    
     def shutdown(self):
         """Safely shutdown all relays"""
         logger.info("Shutting down relay manager...")
-        for relay_id, relay in self.relays.items():
-            relay.set_mode(EquipmentMode.OFF)
-            relay.set_auto_state(False)
+        self.emergency_off()
         
         if GPIO_AVAILABLE:
             time.sleep(0.1)  # Brief delay for relays to switch
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x03\x1e\
+\x00\
+\x00\x0b\x02\x78\x9c\xbd\x55\x4d\x73\xd3\x30\x10\xbd\xe7\x57\x88\
+\xf6\x02\x9d\x86\x26\x8e\xe3\xb6\x62\x38\xd0\x0f\xb8\x74\x28\x21\
+\x19\x38\x30\x0c\x23\x5b\x9b\x58\x53\x45\x32\x92\xdc\xa4\x65\xf8\
+\xef\xc8\xb2\x13\xc7\x76\xbe\xca\x57\x72\x5b\x69\x77\xdf\xbe\xf7\
+\xb4\x1e\x8c\x48\xf8\x99\xd1\x09\x18\x8c\x13\x22\x00\xfd\x68\x21\
+\xfb\x0b\xa5\xa2\xa0\x30\xf2\x92\x39\xd2\x92\x33\x8a\x0e\x7b\xb4\
+\x47\xfb\xd1\xab\x95\xe3\xb6\x22\x94\xa5\x1a\xa3\xb3\x64\x5e\xc4\
+\x49\x74\x37\x51\x32\x15\xb4\x1d\x49\x2e\x6d\x81\xc3\x2e\xe9\x12\
+\x0f\xf2\xe3\x84\x50\xca\xc4\x04\x23\x3f\x4b\xf8\xd9\x1a\xd8\xe6\
+\x17\x44\x61\x6c\x48\xb8\x68\xdc\xac\xd0\x19\xf7\xfc\xa0\x93\x57\
+\x58\xc4\x80\x64\xff\x5a\xd5\x6e\x86\xb6\xb3\xc0\x32\x25\x6a\xc2\
+\x44\x5b\xb1\x49\x6c\xdc\x20\x15\xe8\x46\x26\x6d\x0e\x63\xb3\x66\
+\x86\xf2\x82\xcb\x6d\xde\x18\x4b\x61\xda\x9a\x3d\x82\x6d\x19\x54\
+\x82\x33\xc8\xbb\x85\x92\xd3\xfa\x80\x58\x03\x87\xc8\x00\xdd\x3c\
+\x29\x9c\xfb\xfd\x6c\xd2\x5a\x62\x2c\xef\xad\x16\xcf\x76\xe7\x77\
+\x49\xdf\x3b\x0d\x5c\xfe\x3b\x7b\x92\x5c\xc8\xf9\x9f\xe9\x59\x70\
+\x68\xb9\xb0\xa3\x2e\x99\x5d\x12\x1e\xd4\x22\xc5\x45\x7f\x1d\x51\
+\xfe\x76\xa2\x16\x78\xed\xc4\xcc\xf0\x85\x0d\x75\x1a\x46\xf6\xba\
+\x92\xbc\x2d\xad\x18\x4c\xe0\x02\x52\x5e\x2a\x13\x70\x2d\xb0\x4e\
+\x09\x6d\x0d\xb7\x1f\x52\x1d\x5f\xa4\xc6\x48\xf1\xfb\xa6\x7b\x1a\
+\xa1\x75\xa2\x5c\xc4\xf9\xb5\x49\x54\x6f\x0b\x51\x4e\x13\x2b\x48\
+\x5c\x44\x7b\x41\xf1\x90\xca\x91\x72\xb7\xec\xf6\xc8\x0a\xca\xad\
+\x14\xe1\x44\x81\xd6\x7b\xba\x76\x25\x2d\x8a\x21\xba\xdb\x27\x6d\
+\x6f\x20\x94\x69\x12\xf2\x6d\x25\x3d\xea\x51\xdf\xaf\x8a\x16\xb8\
+\x9f\xab\x75\x25\x53\x9b\x3f\x4c\x98\xb0\x46\x3b\x46\x83\x11\x9b\
+\xc2\x35\x65\x66\x0b\x59\x81\xd7\xed\xc1\xdf\x51\xdc\x3e\x00\x14\
+\xac\x13\xfc\xec\x09\x82\xfb\x9d\x42\xf0\xca\x2c\x78\x2c\xa3\x54\
+\xaf\x4c\x94\x07\x2a\x6f\x7f\x1d\xb9\xd5\x22\x38\x4d\xda\xa1\xa3\
+\xda\x56\xaa\x1d\x51\x39\x13\x8b\xc3\x56\xd9\xa6\x92\x52\x46\x57\
+\x6e\x17\x18\x66\x8c\x9a\x18\x97\xcb\x79\x31\x4f\xa7\xba\x75\x31\
+\x12\x52\x40\x86\xed\xe4\x08\x8d\x60\x9a\x80\x22\x26\x55\x70\xc5\
+\x74\xc2\xc9\x03\x46\x26\x06\x34\x56\x64\x0a\x48\xa5\x76\x4b\x10\
+\xae\xa5\x4d\x9d\x83\x46\xcc\x68\x14\xc5\x8c\x53\xc4\x49\x08\x5c\
+\xa3\xa3\x93\xd6\xe0\x6d\x76\xf5\xd0\xd8\x42\x45\x05\x0b\xb3\x11\
+\x43\x83\x9b\x2c\xe3\x5f\xb8\xe0\xac\x50\xcb\x35\x70\x3d\x2f\x49\
+\x62\xd8\x92\x96\x55\x1b\x78\xf5\x8d\x45\x68\xd8\x0f\x69\x41\xc6\
+\x27\xc2\x53\xc8\x8f\x10\xd3\x48\x83\xb1\x5c\x58\x98\x93\xd8\x71\
+\xe2\x66\xb6\x5e\xe3\x60\x0c\xa0\xe7\x1a\x00\x0d\x47\x6f\x46\xd7\
+\xdf\x2e\x6f\x6f\x6e\x3f\x0e\x11\x13\x68\x92\xb2\x97\xc9\xc3\x0b\
+\xc7\x4b\x89\x27\xaf\xdb\x40\xe3\x6d\xff\xae\x65\x88\xae\xbf\xa7\
+\x2c\x99\x82\x30\x97\xf9\x86\x46\x4a\xce\x10\x11\xd4\x29\x01\x02\
+\xec\x9a\x7e\xb4\x8f\x95\x09\xca\x22\x62\x2c\xec\x52\x10\xa8\xa5\
+\x2e\x55\xa9\x1f\xfc\x07\x69\xb6\x36\x2e\xe3\xef\x33\xcf\x35\x45\
+\xdb\xf1\x55\xdb\xb3\xf8\xd0\x58\x97\xeb\xcd\x53\xfa\xe7\xfd\x4e\
+\xff\x74\xed\x18\xe5\xc7\x2f\x5b\x13\xc5\x33\xf3\xb2\xa0\xfd\x52\
+\xce\x2b\x81\xc6\x32\x29\xaf\x55\x22\x4f\x06\xfe\x85\x44\x86\xdd\
+\xc3\xeb\x03\xa3\x52\x38\xf8\xba\x79\x8e\x7e\x37\x1a\xe7\xbb\x38\
+\x33\xd0\x15\xd1\x71\x28\x89\xa2\x48\xe7\xf3\x67\xe6\x31\x76\x89\
+\xa8\xe2\x09\x1f\xe7\x7e\xb7\x26\x5a\xb1\x3a\x53\x4b\x9b\x97\x4e\
+\xce\x0b\x6c\xf0\xf2\x0e\x91\x7e\x01\xc6\x7f\x7b\x47\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x07\xac\x02\xc3\
+\x00\x73\
+\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x73\
+\x00\x08\
+\x08\x01\x56\xc3\
+\x00\x6d\
+\x00\x61\x00\x69\x00\x6e\x00\x2e\x00\x71\x00\x73\x00\x73\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x12\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x12\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x41\x5d\x93\xac\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -6,20 +6,32 @@ Handles 1-Wire temperature sensor communication on Raspberry Pi
 import os
 import glob
 import logging
-from typing import Dict, Optional
-from dataclasses import dataclass
+import time
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from threading import Lock, Thread, Event
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+
+from compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
 # 1-Wire base path on Raspberry Pi
 ONEWIRE_BASE_PATH = "/sys/bus/w1/devices"
 
+# Bus-wide conversion trigger exposed by the w1_therm driver (kernel 5.10+)
+BULK_READ_GLOB = os.path.join(ONEWIRE_BASE_PATH, "w1_bus_master*", "therm_bulk_read")
+BULK_CONVERT_TIMEOUT = 1.0  # DS18B20 12-bit conversion is 750 ms max
+BULK_POLL_INTERVAL = 0.1
+
+# w1_slave is two ~37 byte lines
+W1_SLAVE_READ_SIZE = 128
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SensorReading:
-    """Represents a temperature reading from a sensor"""
+    """Represents a temperature reading from a sensor (immutable, safe to share)"""
     address: str
     name: str
     temperature_c: Optional[float]
@@ -28,6 +40,14 @@ class SensorReading:
     error: Optional[str] = None
 
 
+@lru_cache(maxsize=1024)
+def _milli_c_to_c_f(milli_c: int) -> Tuple[float, float]:
+    """Convert a raw milli-degree C value to rounded (C, F)"""
+    temp_c = milli_c / 1000.0
+    temp_f = (temp_c * 9.0 / 5.0) + 32.0
+    return round(temp_c, 2), round(temp_f, 2)
+
+
 class TemperatureSensor:
     """Manages a single DS18B20 temperature sensor"""
     
@@ -37,71 +57,93 @@ class TemperatureSensor:
         self.label = label
         self.device_path = os.path.join(ONEWIRE_BASE_PATH, address, "w1_slave")
         self._last_reading: Optional[SensorReading] = None
+        self._last_milli_c: Optional[int] = None  # Raw value behind _last_reading
+        self._fd: Optional[int] = None  # Open w1_slave file, opened on first read
+        self._not_found_error = f"Sensor not found at {self.device_path}"
+        # Most recent failure, reused while the sensor keeps failing the same way
+        self._invalid_reading = SensorReading(
+            address=address,
+            name=name,
+            temperature_c=None,
+            temperature_f=None,
+            valid=False
+        )
         self._lock = Lock()
     
+    def _invalid(self, error: str) -> SensorReading:
+        """Get an invalid reading carrying error"""
+        if self._invalid_reading.error != error:
+            self._invalid_reading = replace(self._invalid_reading, error=error)
+        return self._invalid_reading
+    
+    def read_raw_milli_c(self) -> Tuple[Optional[int], Optional[str]]:
+        """Read the sensor's raw value in milli-degrees C
+        
+        Returns (milli_c, None) on success or (None, error) on failure.
+        """
+        # The device file stays open between reads; a read at offset 0 makes
+        # sysfs regenerate its contents
+        if self._fd is None:
+            try:
+                self._fd = os.open(self.device_path, os.O_RDONLY)
+            except FileNotFoundError:
+                return None, self._not_found_error
+        try:
+            data = os.pread(self._fd, W1_SLAVE_READ_SIZE, 0)
+        except OSError:
+            # Sensor unplugged or bus reset; reopen on the next read
+            self._close_fd()
+            raise
+        
+        # Check for valid CRC (first line ends in YES)
+        newline = data.find(b'\n')
+        if newline == -1 or not data[:newline].endswith(b'YES'):
+            return None, "CRC check failed"
+        
+        # Extract temperature (integer milli-degrees C on the second line)
+        equals_pos = data.rfind(b't=', newline)
+        if equals_pos == -1:
+            return None, "Temperature value not found"
+        
+        return int(data[equals_pos + 2:]), None
+    
     def read_temperature(self) -> SensorReading:
         """Read temperature from the sensor"""
         with self._lock:
             try:
-                if not os.path.exists(self.device_path):
-                    return SensorReading(
-                        address=self.address,
-                        name=self.name,
-                        temperature_c=None,
-                        temperature_f=None,
-                        valid=False,
-                        error=f"Sensor not found at {self.device_path}"
-                    )
+                milli_c, error = self.read_raw_milli_c()
+                if error is not None:
+                    return self._invalid(error)
                 
-                with open(self.device_path, 'r') as f:
-                    lines = f.readlines()
-                
-                # Check for valid CRC
-                if len(lines) < 2 or "YES" not in lines[0]:
-                    return SensorReading(
-                        address=self.address,
-                        name=self.name,
-                        temperature_c=None,
-                        temperature_f=None,
-                        valid=False,
-                        error="CRC check failed"
-                    )
-                
-                # Extract temperature
-                equals_pos = lines[1].find('t=')
-                if equals_pos == -1:
-                    return SensorReading(
-                        address=self.address,
-                        name=self.name,
-                        temperature_c=None,
-                        temperature_f=None,
-                        valid=False,
-                        error="Temperature value not found"
-                    )
-                
-                temp_string = lines[1][equals_pos + 2:]
-                temp_c = float(temp_string) / 1000.0
-                temp_f = (temp_c * 9.0 / 5.0) + 32.0
+                # Sensors sit on the same value for long stretches
+                if self._last_reading is not None and milli_c == self._last_milli_c:
+                    return self._last_reading
                 
+                temp_c, temp_f = _milli_c_to_c_f(milli_c)
+                self._last_milli_c = milli_c
                 self._last_reading = SensorReading(
                     address=self.address,
                     name=self.name,
-                    temperature_c=round(temp_c, 2),
-                    temperature_f=round(temp_f, 2),
+                    temperature_c=temp_c,
+                    temperature_f=temp_f,
                     valid=True
                 )
                 return self._last_reading
                 
             except Exception as e:
-                logger.error(f"Error reading sensor {self.name} ({self.address}): {e}")
-                return SensorReading(
-                    address=self.address,
-                    name=self.name,
-                    temperature_c=None,
-                    temperature_f=None,
-                    valid=False,
-                    error=str(e)
-                )
+                # Reported once per change by SensorManager's read loop
+                logger.debug("Error reading sensor %s (%s): %s", self.name, self.address, e)
+                return self._invalid(str(e))
+    
+    def _close_fd(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+    
+    def close(self):
+        """Close the sensor's device file"""
+        with self._lock:
+            self._close_fd()
     
     @property
     def last_reading(self) -> Optional[SensorReading]:
@@ -114,11 +156,20 @@ class SensorManager:
 
     def __init__(self, sensor_config: Dict):
         self.sensors: Dict[str, TemperatureSensor] = {}
-        self._readings: Dict[str, SensorReading] = {}
+        # Replaced wholesale by the read thread, never mutated in place, so
+        # readers can use whichever dict they see without locking or copying
         self._cached_readings: Dict[str, SensorReading] = {}
-        self._lock = Lock()
         self._stop_event = Event()
         self._read_thread: Optional[Thread] = None
+        # Last error logged per sensor (read thread only)
+        self._last_errors: Dict[str, str] = {}
+        # therm_bulk_read files; empty on older kernels (per-sensor conversions)
+        self._bulk_read_paths = glob.glob(BULK_READ_GLOB)
+        if self._bulk_read_paths:
+            logger.info("Using w1_therm bulk conversion for sensor reads")
+        # Without bulk conversion each read waits out its own conversion, so
+        # those reads are issued from a small pool of worker threads
+        self._read_pool: Optional[ThreadPoolExecutor] = None
 
         # Initialize sensors from config
         for sensor_id, config in sensor_config.items():
@@ -129,6 +180,10 @@ class SensorManager:
             )
             logger.info(f"Initialized sensor: {config['name']} ({config['address']})")
 
+        if not self._bulk_read_paths and len(self.sensors) > 1:
+            self._read_pool = ThreadPoolExecutor(max_workers=len(self.sensors),
+                                                 thread_name_prefix="sensor-read")
+
         # Start background reading thread
         self._start_read_thread()
 
@@ -139,24 +194,70 @@ class SensorManager:
         self._read_thread.start()
         logger.info("Sensor read thread started")
 
+    def _bulk_convert(self) -> bool:
+        """Start one conversion on every sensor of each bus and wait for it
+        
+        After a bulk conversion the driver answers w1_slave reads from the
+        sensors' scratchpads instead of running a 750 ms conversion per
+        sensor. Returns False if bulk conversion isn't available or failed,
+        in which case reads fall back to per-sensor conversions.
+        """
+        if not self._bulk_read_paths:
+            return False
+        
+        try:
+            for path in self._bulk_read_paths:
+                with open(path, 'w') as f:
+                    f.write("trigger\n")
+            
+            # Each file reads -1 while its conversion is still in progress
+            pending = list(self._bulk_read_paths)
+            deadline = time.monotonic() + BULK_CONVERT_TIMEOUT
+            while pending and time.monotonic() < deadline:
+                if self._stop_event.wait(BULK_POLL_INTERVAL):
+                    return False
+                pending = [path for path in pending if self._bulk_in_progress(path)]
+            return not pending
+        except OSError as e:
+            logger.warning(f"Bulk sensor conversion failed: {e}")
+            return False
+    
+    @staticmethod
+    def _bulk_in_progress(path: str) -> bool:
+        with open(path, 'r') as f:
+            return f.read().strip() == "-1"
+    
     def _read_loop(self):
         """Background loop that continuously reads sensors"""
         while not self._stop_event.is_set():
             try:
-                # Read all sensors (this is the slow operation)
+                # Convert on all sensors at once, then read each (the slow part
+                # when bulk conversion isn't available)
+                if self._bulk_convert() or self._read_pool is None:
+                    readings = [sensor.read_temperature() for sensor in self.sensors.values()]
+                else:
+                    # Per-sensor conversions: overlap their waits across threads
+                    readings = list(self._read_pool.map(
+                        TemperatureSensor.read_temperature, self.sensors.values()))
+
                 new_readings = {}
-                for sensor_id, sensor in self.sensors.items():
-                    reading = sensor.read_temperature()
+                debug = logger.isEnabledFor(logging.DEBUG)
+                for (sensor_id, sensor), reading in zip(self.sensors.items(), readings):
                     new_readings[sensor_id] = reading
+                    last_error = self._last_errors.get(sensor_id)
                     if reading.valid:
-                        logger.debug(f"{sensor.name}: {reading.temperature_f}°F")
-                    else:
-                        logger.warning(f"{sensor.name}: {reading.error}")
-
-                # Quick lock to update cached readings
-                with self._lock:
-                    self._readings = new_readings
-                    self._cached_readings = deepcopy(new_readings)
+                        if last_error is not None:
+                            logger.info("%s: reading again", sensor.name)
+                            del self._last_errors[sensor_id]
+                        if debug:
+                            logger.debug("%s: %s°F", sensor.name, reading.temperature_f)
+                    elif reading.error != last_error:
+                        # Only log a fault when it starts or changes, not every poll
+                        logger.warning("%s: %s", sensor.name, reading.error)
+                        self._last_errors[sensor_id] = reading.error
+
+                # Publish the new readings with a single reference swap
+                self._cached_readings = new_readings
 
             except Exception as e:
                 logger.error(f"Error in sensor read loop: {e}")
@@ -165,14 +266,12 @@ class SensorManager:
             self._stop_event.wait(2.0)
 
     def read_all(self) -> Dict[str, SensorReading]:
-        """Return cached readings (non-blocking)"""
-        with self._lock:
-            return deepcopy(self._cached_readings)
+        """Return cached readings (non-blocking; treat the dict as read-only)"""
+        return self._cached_readings
 
     def get_reading(self, sensor_id: str) -> Optional[SensorReading]:
         """Get the last reading for a specific sensor (non-blocking)"""
-        with self._lock:
-            return self._cached_readings.get(sensor_id)
+        return self._cached_readings.get(sensor_id)
 
     def get_temperature_f(self, sensor_id: str) -> Optional[float]:
         """Get temperature in Fahrenheit for a specific sensor"""
@@ -182,23 +281,29 @@ class SensorManager:
         return None
 
     def get_all_readings(self) -> Dict[str, SensorReading]:
-        """Get all current readings (non-blocking)"""
-        with self._lock:
-            return deepcopy(self._cached_readings)
+        """Get all current readings (non-blocking; treat the dict as read-only)"""
+        return self._cached_readings
 
     def shutdown(self):
         """Stop the background read thread"""
         self._stop_event.set()
         if self._read_thread and self._read_thread.is_alive():
             self._read_thread.join(timeout=3.0)
+        if self._read_pool is not None:
+            self._read_pool.shutdown(wait=False)
+        for sensor in self.sensors.values():
+            sensor.close()
         logger.info("Sensor manager shutdown")
 
     @staticmethod
     def discover_sensors() -> list:
         """Discover all connected 1-Wire sensors"""
         try:
-            devices = glob.glob(os.path.join(ONEWIRE_BASE_PATH, "28-*"))
-            addresses = [os.path.basename(d) for d in devices]
+            try:
+                with os.scandir(ONEWIRE_BASE_PATH) as entries:
+                    addresses = [e.name for e in entries if e.name.startswith("28-")]
+            except FileNotFoundError:
+                addresses = []  # 1-Wire bus not enabled
             logger.info(f"Discovered {len(addresses)} temperature sensors")
             return addresses
         except Exception as e:
@@ -215,6 +320,7 @@ class MockSensorManager:
         self._readings: Dict[str, SensorReading] = {}
         self._lock = Lock()
         self._mock_temps: Dict[str, float] = {}
+        self._dirty = True  # Readings need rebuilding from _mock_temps
 
         # Initialize with mock temperatures
         default_temps = {
@@ -238,21 +344,26 @@ class MockSensorManager:
         """Set mock temperature for testing"""
         with self._lock:
             self._mock_temps[sensor_id] = temp_f
+            self._dirty = True
 
     def read_all(self) -> Dict[str, SensorReading]:
-        """Return mock readings"""
+        """Return mock readings (rebuilt only after a temperature changes)"""
         with self._lock:
-            for sensor_id, sensor in self.sensors.items():
-                temp_f = self._mock_temps.get(sensor_id, 70.0)
-                temp_c = (temp_f - 32.0) * 5.0 / 9.0
-                self._readings[sensor_id] = SensorReading(
-                    address=sensor.address,
-                    name=sensor.name,
-                    temperature_c=round(temp_c, 2),
-                    temperature_f=round(temp_f, 2),
-                    valid=True
-                )
-            return deepcopy(self._readings)
+            if self._dirty:
+                readings = {}
+                for sensor_id, sensor in self.sensors.items():
+                    temp_f = self._mock_temps.get(sensor_id, 70.0)
+                    temp_c = (temp_f - 32.0) * 5.0 / 9.0
+                    readings[sensor_id] = SensorReading(
+                        address=sensor.address,
+                        name=sensor.name,
+                        temperature_c=round(temp_c, 2),
+                        temperature_f=round(temp_f, 2),
+                        valid=True
+                    )
+                self._readings = readings
+                self._dirty = False
+            return self._readings
 
     def get_reading(self, sensor_id: str) -> Optional[SensorReading]:
         """Get the last reading for a specific sensor"""
@@ -267,9 +378,9 @@ class MockSensorManager:
         return None
 
     def get_all_readings(self) -> Dict[str, SensorReading]:
-        """Get all current readings"""
+        """Get all current readings (treat the dict as read-only)"""
         with self._lock:
-            return deepcopy(self._readings)
+            return self._readings
 
     def shutdown(self):
         """No-op for mock manager"""
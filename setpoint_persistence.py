@@ -3,23 +3,27 @@ Snowmelt Control System - Setpoint Persistence Module
 Handles saving and loading user-modified setpoints to survive reboots
 """
 
+import json
 import logging
-import shutil
+import os
+import time
 from pathlib import Path
-from threading import Lock, Timer
+from threading import Condition, Lock, Thread
 from typing import Dict, Optional
 from dataclasses import dataclass, asdict
 
-import yaml
+from compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
 # Default persistence file location (same directory as this module)
-DEFAULT_STATE_FILE = Path(__file__).parent / "setpoints_state.yaml"
+DEFAULT_STATE_FILE = Path(__file__).parent / "setpoints_state.json"
+# Older releases persisted YAML next to the JSON file; migrated on first load
+LEGACY_SUFFIX = ".yaml"
 SAVE_DEBOUNCE_SECONDS = 5.0
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PersistedSetpoints:
     """Data structure for persistent setpoints"""
     glycol_high_temp: float
@@ -56,9 +60,17 @@ class SetpointPersistence:
         self.state_file = Path(state_file)
         self.debounce_seconds = debounce_seconds
         self._lock = Lock()
+        self._wake = Condition(self._lock)  # Signals the writer thread
+        self._write_lock = Lock()  # Serializes file writes
         self._pending_save: Optional[PersistedSetpoints] = None
-        self._save_timer: Optional[Timer] = None
+        self._save_due = 0.0  # time.monotonic() when the pending save is written
         self._shutdown = False
+        # What the state file currently holds, to skip rewriting identical data
+        self._last_saved_dict: Optional[Dict] = None
+
+        # One long-lived writer thread handles every debounced save
+        self._writer = Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
 
         logger.info(f"Setpoint persistence initialized: {self.state_file}")
 
@@ -82,24 +94,41 @@ class SetpointPersistence:
         }
 
         # Try to load persisted state and merge
-        if self.state_file.exists():
+        legacy_file = self.state_file.with_suffix(LEGACY_SUFFIX)
+        migrate = (not self.state_file.exists() and legacy_file != self.state_file
+                   and legacy_file.exists())
+        source = legacy_file if migrate else self.state_file
+
+        if source.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    persisted = yaml.safe_load(f) or {}
+                with open(source, 'r') as f:
+                    if migrate:
+                        import yaml
+                        persisted = yaml.safe_load(f) or {}
+                    else:
+                        persisted = json.load(f)
 
                 # Override defaults with persisted values
                 for key in merged.keys():
                     if key in persisted:
                         merged[key] = persisted[key]
 
-                logger.info(f"Loaded persisted setpoints from {self.state_file}")
+                if not migrate and persisted.keys() >= merged.keys():
+                    self._last_saved_dict = PersistedSetpoints.from_dict(merged).to_dict()
+
+                logger.info(f"Loaded persisted setpoints from {source}")
             except Exception as e:
                 logger.error(f"Error loading persisted setpoints: {e}")
                 logger.warning("Using default setpoints")
+                migrate = False
         else:
             logger.info("No persisted setpoints found, using defaults")
 
-        return PersistedSetpoints.from_dict(merged)
+        setpoints = PersistedSetpoints.from_dict(merged)
+        if migrate:
+            logger.info(f"Migrating persisted setpoints to {self.state_file}")
+            self._write(setpoints)
+        return setpoints
 
     def save(self, setpoints: PersistedSetpoints):
         """Queue setpoints for debounced save to minimize SD card writes"""
@@ -107,38 +136,68 @@ class SetpointPersistence:
             if self._shutdown:
                 return
 
+            # Each change restarts the debounce window
             self._pending_save = setpoints
+            self._save_due = time.monotonic() + self.debounce_seconds
+            self._wake.notify()
 
-            # Cancel existing timer
-            if self._save_timer is not None:
-                self._save_timer.cancel()
+            logger.debug("Setpoint save queued (debounced)")
 
-            # Start new timer
-            self._save_timer = Timer(self.debounce_seconds, self._do_save)
-            self._save_timer.daemon = True
-            self._save_timer.start()
+    def _writer_loop(self):
+        """Write pending setpoints once they've been quiet for the debounce period"""
+        while True:
+            with self._lock:
+                while not self._shutdown:
+                    if self._pending_save is None:
+                        self._wake.wait()
+                        continue
+                    remaining = self._save_due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
 
-            logger.debug("Setpoint save queued (debounced)")
+                if self._shutdown:
+                    return
+
+            self._do_save()
 
     def _do_save(self):
         """Actually perform the atomic save"""
-        with self._lock:
-            if self._pending_save is None:
-                return
+        with self._write_lock:
+            with self._lock:
+                if self._pending_save is None:
+                    return
+
+                setpoints = self._pending_save
+                self._pending_save = None
 
-            setpoints = self._pending_save
-            self._pending_save = None
-            self._save_timer = None
+            self._write(setpoints)
+
+    def _write(self, setpoints: PersistedSetpoints):
+        """Write setpoints to the state file"""
+        data = setpoints.to_dict()
+        if data == self._last_saved_dict:
+            logger.debug("Setpoints unchanged, skipping write")
+            return
 
         try:
             # Write to temp file first (atomic write pattern)
             temp_file = self.state_file.with_suffix('.tmp')
 
             with open(temp_file, 'w') as f:
-                yaml.safe_dump(setpoints.to_dict(), f, default_flow_style=False)
-
-            # Atomic rename
-            shutil.move(str(temp_file), str(self.state_file))
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Atomic rename, then sync the directory so the rename itself
+            # survives a power cut
+            os.replace(temp_file, self.state_file)
+            dir_fd = os.open(self.state_file.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+            self._last_saved_dict = data
 
             logger.info(f"Setpoints persisted to {self.state_file}")
         except Exception as e:
@@ -146,11 +205,6 @@ class SetpointPersistence:
 
     def save_now(self):
         """Force immediate save (for shutdown)"""
-        with self._lock:
-            if self._save_timer is not None:
-                self._save_timer.cancel()
-                self._save_timer = None
-
         # Perform save directly if there's pending data
         self._do_save()
 
@@ -158,9 +212,7 @@ class SetpointPersistence:
         """Clean shutdown - save any pending changes immediately"""
         with self._lock:
             self._shutdown = True
-            if self._save_timer is not None:
-                self._save_timer.cancel()
-                self._save_timer = None
+            self._wake.notify()
 
         # Save any pending changes
         self._do_save()
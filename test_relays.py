@@ -4,17 +4,36 @@ Snowmelt Control System - Relay Test Utility
 Tests individual relays on the Oono 8-relay HAT
 """
 
+import io
+import os
+import mmap
 import sys
 import time
-import argparse
+import signal
+import selectors
+from functools import partial
 
 try:
     import RPi.GPIO as GPIO
     GPIO_AVAILABLE = True
 except ImportError:
     GPIO_AVAILABLE = False
-    print("Warning: RPi.GPIO not available - running in simulation mode")
+    
+    # Simulation mode: accept every call and do nothing
+    class _NullGPIO:
+        BCM = 11
+        OUT = 0
+        HIGH = 1
+        LOW = 0
+        
+        @staticmethod
+        def output(*args, **kwargs): pass
+        
+        setup = setmode = setwarnings = cleanup = output
+    
+    GPIO = _NullGPIO
 
+_HIGH, _LOW, _BCM, _OUT = GPIO.HIGH, GPIO.LOW, GPIO.BCM, GPIO.OUT
 
 # Relay to GPIO pin mapping (BCM mode)
 # Adjust these based on your specific Oono HAT documentation
@@ -44,68 +63,260 @@ RELAY_NAMES = {
     8: "Unused",
 }
 
+# Pause between relays in --test-all so each click is distinct; a quarter of
+# the test duration, within these bounds
+RELAY_TEST_GAP_MIN = 0.05
+RELAY_TEST_GAP_MAX = 0.5
+
+# Relay numbers in order (1-8)
+_RELAY_IDS = tuple(sorted(RELAY_GPIO_MAP))
+_VALID_IDS = frozenset(_RELAY_IDS)
+
+# Lookup tables indexed by relay number (index 0 unused)
+_PIN = (None,) + tuple(RELAY_GPIO_MAP[i] for i in _RELAY_IDS)
+_NAME = (None,) + tuple(RELAY_NAMES.get(i, f"Relay {i}") for i in _RELAY_IDS)
+_PINS_LIST = list(RELAY_GPIO_MAP.values())
+# Output level indexed by the wanted relay state (False/True)
+_LEVEL = (_HIGH, _LOW) if ACTIVE_LOW else (_LOW, _HIGH)
+# Ready-made pin writes per relay, so switching is a single call
+_OFF_FNS = (None,) + tuple(partial(GPIO.output, pin, _LEVEL[False]) for pin in _PIN[1:])
+_ON_FNS = (None,) + tuple(partial(GPIO.output, pin, _LEVEL[True]) for pin in _PIN[1:])
+# Indexed by the wanted relay state, then relay number
+_SWITCH_FNS = (_OFF_FNS, _ON_FNS)
+
+# test_single_relay headers, pre-encoded (index 0 unused)
+_BANNERS = (None,) + tuple(
+    f"\nTesting Relay {i} ({RELAY_NAMES.get(i, 'Unknown')})...\n"
+    f"  GPIO Pin: {RELAY_GPIO_MAP[i]}\n".encode()
+    for i in _RELAY_IDS
+)
+
+# --list-pins output (the mapping is fixed, so it's built once)
+_PINS_TABLE = "".join(
+    ["\nRelay to GPIO Pin Mapping:\n", "-" * 50 + "\n"]
+    + [f"  Relay {i}: GPIO {RELAY_GPIO_MAP[i]:<3} - {RELAY_NAMES.get(i, 'Unused')}\n"
+       for i in _RELAY_IDS]
+    + ["-" * 50 + "\n", f"Active Low: {ACTIVE_LOW}\n", "\n"]
+)
+
+# BCM2835-family GPIO set/clear registers (32-bit word offsets into the
+# /dev/gpiomem page). The Pi 5 (BCM2712/RP1) has a different layout.
+_GPIO_SOCS = (b'bcm2835', b'bcm2836', b'bcm2837', b'bcm2711')
+_GPSET0 = 0x1C // 4
+_GPCLR0 = 0x28 // 4
+# Register that drives the relays to each wanted state (False/True)
+_ALL_REG = (_GPSET0, _GPCLR0) if ACTIVE_LOW else (_GPCLR0, _GPSET0)
+_MASK_ALL = sum(1 << pin for pin in _PINS_LIST)
+# 32-bit view of the mapped GPIO registers, set up by setup_gpio where possible
+_gpio_regs = None
+
+
+def _map_gpio_registers():
+    """Map the GPIO registers from /dev/gpiomem, or return None if unsupported"""
+    if max(_PINS_LIST) > 31:
+        return None
+    try:
+        with open('/proc/device-tree/compatible', 'rb') as f:
+            compatible = f.read()
+    except OSError:
+        return None
+    if not any(soc in compatible for soc in _GPIO_SOCS):
+        return None
+    
+    try:
+        fd = os.open('/dev/gpiomem', os.O_RDWR | os.O_SYNC)
+    except OSError:
+        return None
+    try:
+        # Word-sized view so each register write is a single 32-bit store
+        return memoryview(mmap.mmap(fd, mmap.PAGESIZE)).cast('I')
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+
 
 def setup_gpio():
     """Initialize GPIO"""
-    if GPIO_AVAILABLE:
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setwarnings(False)
-        for relay_num, gpio_pin in RELAY_GPIO_MAP.items():
-            GPIO.setup(gpio_pin, GPIO.OUT)
-            # Ensure all relays start OFF
-            GPIO.output(gpio_pin, GPIO.HIGH if ACTIVE_LOW else GPIO.LOW)
+    global _gpio_regs
+    GPIO.setmode(_BCM)
+    GPIO.setwarnings(False)
+    # All relay pins become outputs driven OFF from the start
+    GPIO.setup(_PINS_LIST, _OUT, initial=_LEVEL[False])
+    # RPi.GPIO keeps handling pin directions; the mapping is only used to
+    # switch every relay at once (never in simulation mode)
+    _gpio_regs = _map_gpio_registers() if GPIO_AVAILABLE else None
 
 
 def cleanup_gpio():
     """Cleanup GPIO"""
-    if GPIO_AVAILABLE:
-        GPIO.cleanup()
+    global _gpio_regs
+    _gpio_regs = None
+    GPIO.cleanup()
 
 
-def set_relay(relay_num, state):
-    """Set relay state"""
-    if relay_num not in RELAY_GPIO_MAP:
-        print(f"Invalid relay number: {relay_num}")
+def _set_relay_silent(relay_num, state):
+    """Switch a relay without reporting it (relay_num must be valid)"""
+    _SWITCH_FNS[bool(state)][relay_num]()
+
+
+def set_relay(relay_num, state, file=None):
+    """Set relay state (status line goes to file, default stdout)"""
+    if not 0 < relay_num < len(_PIN):
+        print(f"Invalid relay number: {relay_num}", file=file)
         return False
     
-    gpio_pin = RELAY_GPIO_MAP[relay_num]
-    name = RELAY_NAMES.get(relay_num, f"Relay {relay_num}")
-    
-    if GPIO_AVAILABLE:
-        if ACTIVE_LOW:
-            GPIO.output(gpio_pin, GPIO.LOW if state else GPIO.HIGH)
-        else:
-            GPIO.output(gpio_pin, GPIO.HIGH if state else GPIO.LOW)
+    _set_relay_silent(relay_num, state)
     
     state_str = "ON" if state else "OFF"
-    print(f"Relay {relay_num} ({name}): {state_str}")
+    print(f"Relay {relay_num} ({_NAME[relay_num]}): {state_str}", file=file)
     return True
 
 
-def test_single_relay(relay_num, duration=2.0):
-    """Test a single relay"""
-    print(f"\nTesting Relay {relay_num} ({RELAY_NAMES.get(relay_num, 'Unknown')})...")
-    print(f"  GPIO Pin: {RELAY_GPIO_MAP.get(relay_num, 'Unknown')}")
+def set_all_relays(state):
+    """Set every relay at once with a single GPIO write"""
+    if _gpio_regs is not None:
+        # One store to GPSET0/GPCLR0 switches all relay pins together
+        _gpio_regs[_ALL_REG[bool(state)]] = _MASK_ALL
+    else:
+        GPIO.output(_PINS_LIST, [_LEVEL[bool(state)]] * len(_PINS_LIST))
     
-    set_relay(relay_num, True)
-    time.sleep(duration)
-    set_relay(relay_num, False)
-    print(f"  Test complete\n")
+    print(f"All relays {'ON' if state else 'OFF'}")
 
 
-def test_all_relays(duration=1.0):
-    """Test all relays sequentially"""
-    print("\n" + "=" * 50)
-    print("  Testing All Relays Sequentially")
-    print("=" * 50)
+def _sleep_until(deadline):
+    """Sleep until a time.monotonic() deadline (returns at once if it has passed)"""
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _write_stdout(data):
+    """Write bytes straight to the stdout fd, after anything print() buffered"""
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def _flush_to_stdout(out, prefix=b""):
+    """Write prefix and buffered output to stdout in one go and empty the buffer"""
+    _write_stdout(prefix + out.getvalue().encode())
+    out.seek(0)
+    out.truncate(0)
+
+
+def test_single_relay(relay_num, duration=2.0, start=None, state_dict=None):
+    """Test a single relay
+    
+    The relay is switched on at start (a time.monotonic() value, default now)
+    and off duration seconds later. Returns the scheduled switch-off time.
+    If given, state_dict (relay number -> on) is kept up to date.
+    """
+    # Output is collected and written once before and once after the wait
+    out = io.StringIO()
+    
+    deadline = (time.monotonic() if start is None else start) + duration
+    set_relay(relay_num, True, file=out)
+    if state_dict is not None:
+        state_dict[relay_num] = True
+    _flush_to_stdout(out, prefix=_BANNERS[relay_num])
+    _sleep_until(deadline)
+    set_relay(relay_num, False, file=out)
+    if state_dict is not None:
+        state_dict[relay_num] = False
+    print(f"  Test complete\n", file=out)
+    _flush_to_stdout(out)
+    return deadline
+
+
+def test_all_relays(duration=1.0, state_dict=None):
+    """Test all relays sequentially (updating state_dict if given)"""
+    sys.stdout.write("\n" + "=" * 50 + "\n  Testing All Relays Sequentially\n" + "=" * 50 + "\n")
+    
+    gap = min(RELAY_TEST_GAP_MAX, max(RELAY_TEST_GAP_MIN, duration * 0.25))
     
-    for relay_num in range(1, 9):
-        test_single_relay(relay_num, duration)
-        time.sleep(0.5)
+    # Schedule against absolute deadlines so print/GPIO time doesn't add up
+    start = time.monotonic()
+    for relay_num in _RELAY_IDS:
+        _sleep_until(start)
+        start = test_single_relay(relay_num, duration, start, state_dict) + gap
     
     print("All relay tests complete!")
 
 
+def _quit(relay_states):
+    return False
+
+
+def _do_test_all(relay_states):
+    test_all_relays(1.0, relay_states)
+    return True
+
+
+def _do_status(relay_states):
+    # Assemble the table and write it in one call
+    rows = [f"  {i}: {_NAME[i]:<20} [{'ON' if relay_states[i] else 'OFF'}]\n"
+            for i in _RELAY_IDS]
+    sys.stdout.write("\nRelay Status:\n" + "".join(rows) + "\n")
+    return True
+
+
+# Single-word interactive commands; handlers return False to quit
+_CMDS = {
+    'quit': _quit,
+    'q': _quit,
+    'exit': _quit,
+    'test': _do_test_all,
+    'status': _do_status,
+}
+
+_ACTIONS = {'on': True, 'off': False}
+
+
+def _dispatch(cmd, relay_states):
+    """Run one interactive command; returns False when the user asks to quit"""
+    cmd = cmd.strip().lower()
+    
+    if not cmd:
+        return True
+    
+    handler = _CMDS.get(cmd)
+    if handler is not None:
+        return handler(relay_states)
+    
+    parts = cmd.split(maxsplit=1)
+    if len(parts) != 2:
+        print("Invalid command. Use: <relay#> <on|off> or 'help'")
+        return True
+    
+    relay_str, action = parts
+    
+    state = _ACTIONS.get(action)
+    if state is None:
+        print("Action must be 'on' or 'off'")
+        return True
+    
+    if relay_str == 'all':
+        set_all_relays(state)
+        relay_states.update(dict.fromkeys(_RELAY_IDS, state))
+        return True
+    
+    try:
+        relay_num = int(relay_str)
+    except ValueError:
+        print("Invalid relay number")
+        return True
+    
+    if relay_num in _VALID_IDS:
+        set_relay(relay_num, state)
+        relay_states[relay_num] = state
+    else:
+        print("Relay number must be 1-8")
+    
+    return True
+
+
 def interactive_mode():
     """Interactive relay control"""
     print("\n" + "=" * 50)
@@ -121,108 +332,202 @@ def interactive_mode():
     print("  quit      - Exit")
     print()
     
-    relay_states = {i: False for i in range(1, 9)}
+    relay_states = dict.fromkeys(_RELAY_IDS, False)
     
-    while True:
-        try:
-            cmd = input("relay> ").strip().lower()
-            
-            if not cmd:
-                continue
-            
-            if cmd == 'quit' or cmd == 'q' or cmd == 'exit':
-                break
-            
-            if cmd == 'test':
-                test_all_relays(1.0)
-                continue
-            
-            if cmd == 'status':
-                print("\nRelay Status:")
-                for i in range(1, 9):
-                    state = "ON" if relay_states[i] else "OFF"
-                    name = RELAY_NAMES.get(i, f"Relay {i}")
-                    print(f"  {i}: {name:<20} [{state}]")
-                print()
-                continue
-            
-            parts = cmd.split()
-            if len(parts) != 2:
-                print("Invalid command. Use: <relay#> <on|off> or 'help'")
-                continue
-            
-            relay_str, action = parts
-            
-            if action not in ('on', 'off'):
-                print("Action must be 'on' or 'off'")
-                continue
-            
-            state = action == 'on'
+    # Wait on stdin and a signal wakeup pipe together: each wakeup reads
+    # whatever input has arrived in one go, and Ctrl+C wakes the wait instead
+    # of raising KeyboardInterrupt out of the blocking read
+    stdin_fd = sys.stdin.fileno()
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_w, False)
+    sel = selectors.DefaultSelector()
+    sel.register(stdin_fd, selectors.EVENT_READ)
+    sel.register(wake_r, selectors.EVENT_READ)
+    old_wakeup_fd = signal.set_wakeup_fd(wake_w)
+    int_handler = signal.getsignal(signal.SIGINT)
+    interrupted = False
+    
+    def on_sigint(signum, frame):
+        nonlocal interrupted
+        interrupted = True
+    
+    buf = bytearray()
+    running = True
+    try:
+        while running:
+            sys.stdout.write("relay> ")
+            sys.stdout.flush()
             
-            if relay_str == 'all':
-                for i in range(1, 9):
-                    set_relay(i, state)
-                    relay_states[i] = state
-            else:
+            while b'\n' not in buf:
+                # Ctrl+C only sets the flag while idle at the prompt; while a
+                # command runs it still interrupts it
+                signal.signal(signal.SIGINT, on_sigint)
                 try:
-                    relay_num = int(relay_str)
-                    if 1 <= relay_num <= 8:
-                        set_relay(relay_num, state)
-                        relay_states[relay_num] = state
-                    else:
-                        print("Relay number must be 1-8")
-                except ValueError:
-                    print("Invalid relay number")
-                    
-        except KeyboardInterrupt:
-            print("\n")
-            break
-        except EOFError:
-            break
+                    events = sel.select()
+                finally:
+                    signal.signal(signal.SIGINT, int_handler)
+                if interrupted:
+                    print("\n")
+                    return
+                ready = [key.fd for key, _ in events]
+                if wake_r in ready:
+                    os.read(wake_r, 512)  # Some other signal; drain and carry on
+                if stdin_fd not in ready:
+                    continue
+                data = os.read(stdin_fd, 4096)
+                if not data:
+                    # EOF: run any unterminated last line, then stop
+                    if buf:
+                        _dispatch(buf.decode(errors='replace'), relay_states)
+                    return
+                buf += data
+            
+            *lines, rest = buf.split(b'\n')
+            buf = bytearray(rest)
+            for line in lines:
+                if not _dispatch(line.decode(errors='replace'), relay_states):
+                    running = False
+                    break
+    except KeyboardInterrupt:
+        print("\n")
+    finally:
+        signal.set_wakeup_fd(old_wakeup_fd)
+        sel.close()
+        os.close(wake_r)
+        os.close(wake_w)
+
+
+_USAGE = """\
+usage: test_relays.py [-h] [--test N] [--test-all] [--interactive]
+                      [--duration DURATION] [--list-pins]
+"""
+
+_HELP = _USAGE + """
+Relay Test Utility
+
+options:
+  -h, --help            show this help message and exit
+  --test N              Test specific relay (1-8)
+  --test-all            Test all relays sequentially
+  --interactive, -i     Interactive mode
+  --duration DURATION, -d DURATION
+                        Test duration in seconds (default: 2.0); with
+                        --test-all the gap between relays scales with it
+  --list-pins           List relay to GPIO pin mapping
+"""
+
+
+class _Args:
+    """Parsed command line options"""
+    test = None
+    test_all = False
+    interactive = False
+    duration = 2.0
+    list_pins = False
+
+
+def _usage_error(message):
+    sys.stderr.write(f"{_USAGE}test_relays.py: error: {message}\n")
+    sys.exit(2)
+
+
+def _relay_id(text):
+    try:
+        relay_num = int(text)
+    except ValueError:
+        _usage_error(f"argument --test: invalid int value: '{text}'")
+    if relay_num not in _VALID_IDS:
+        _usage_error(f"argument --test: relay must be 1-8, got {relay_num}")
+    return relay_num
+
+
+def _duration(text):
+    try:
+        return float(text)
+    except ValueError:
+        _usage_error(f"argument --duration/-d: invalid float value: '{text}'")
+
+
+def _resolve_long_flag(flag, options):
+    """Match a long flag exactly or by unique prefix, as argparse does"""
+    if flag in options:
+        return flag
+    matches = [option for option in options
+               if option.startswith('--') and option.startswith(flag)]
+    if len(matches) > 1:
+        _usage_error(f"ambiguous option: {flag} could match {', '.join(matches)}")
+    return matches[0] if matches else None
+
+
+def _parse_args(argv):
+    """Parse command line flags (by hand: argparse takes longer to import than
+    the rest of this script takes to run)"""
+    args = _Args()
+    # Flag -> (attribute, value converter or None for a switch)
+    options = {
+        '--help': ('help', None),
+        '-h': ('help', None),
+        '--test': ('test', _relay_id),
+        '--test-all': ('test_all', None),
+        '--interactive': ('interactive', None),
+        '-i': ('interactive', None),
+        '--duration': ('duration', _duration),
+        '-d': ('duration', _duration),
+        '--list-pins': ('list_pins', None),
+    }
+    
+    pending = list(reversed(argv))
+    while pending:
+        arg = pending.pop()
+        value = None
+        
+        if arg.startswith('--'):
+            # --flag, --flag=value, or a unique prefix of either
+            name, eq, explicit = arg.partition('=')
+            flag = _resolve_long_flag(name, options)
+            if eq:
+                value = explicit
+        elif arg.startswith('-') and len(arg) > 2:
+            # -dVALUE, -d=VALUE, or bundled switches such as -ih
+            flag = arg[:2]
+            value = arg[2:]
+            if flag in options and options[flag][1] is None:
+                pending.append('-' + value)
+                value = None
+            elif value.startswith('='):
+                value = value[1:]
+        else:
+            flag = arg
+        
+        if flag not in options:
+            _usage_error(f"unrecognized arguments: {arg}")
+        attr, convert = options[flag]
+        
+        if attr == 'help':
+            sys.stdout.write(_HELP)
+            sys.exit(0)
+        
+        if convert is None:
+            if value is not None:
+                _usage_error(f"argument {flag}: ignored explicit argument '{value}'")
+            setattr(args, attr, True)
+            continue
+        
+        if value is None:
+            value = pending.pop() if pending else None
+            if value is None:
+                label = '--duration/-d' if attr == 'duration' else flag
+                _usage_error(f"argument {label}: expected one argument")
+        setattr(args, attr, convert(value))
+    
+    return args
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Relay Test Utility')
-    parser.add_argument(
-        '--test',
-        type=int,
-        choices=range(1, 9),
-        metavar='N',
-        help='Test specific relay (1-8)'
-    )
-    parser.add_argument(
-        '--test-all',
-        action='store_true',
-        help='Test all relays sequentially'
-    )
-    parser.add_argument(
-        '--interactive', '-i',
-        action='store_true',
-        help='Interactive mode'
-    )
-    parser.add_argument(
-        '--duration', '-d',
-        type=float,
-        default=2.0,
-        help='Test duration in seconds (default: 2.0)'
-    )
-    parser.add_argument(
-        '--list-pins',
-        action='store_true',
-        help='List relay to GPIO pin mapping'
-    )
-    
-    args = parser.parse_args()
+    args = _parse_args(sys.argv[1:])
     
     if args.list_pins:
-        print("\nRelay to GPIO Pin Mapping:")
-        print("-" * 50)
-        for relay_num, gpio_pin in sorted(RELAY_GPIO_MAP.items()):
-            name = RELAY_NAMES.get(relay_num, "Unused")
-            print(f"  Relay {relay_num}: GPIO {gpio_pin:<3} - {name}")
-        print("-" * 50)
-        print(f"Active Low: {ACTIVE_LOW}")
-        print()
+        sys.stdout.write(_PINS_TABLE)
         return
     
     print("=" * 50)
@@ -243,7 +548,7 @@ def main():
             interactive_mode()
         else:
             # Default: show help
-            parser.print_help()
+            sys.stdout.write(_HELP)
             print("\nExamples:")
             print("  ./test_relays.py --test 1          # Test relay 1")
             print("  ./test_relays.py --test-all        # Test all relays")
@@ -253,8 +558,7 @@ def main():
     finally:
         # Turn off all relays before exit
         print("\nTurning off all relays...")
-        for relay_num in range(1, 9):
-            set_relay(relay_num, False)
+        set_all_relays(False)
         cleanup_gpio()
         print("Done.")
 